@@ -11,9 +11,22 @@ TC4017 - Calidad de Software
 Tecnologico de Monterrey
 """
 
+import os
 import sys
 import time
 
+# Directory with the code shared by P1, P2 and P3
+COMMON_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "common")
+if COMMON_DIR not in sys.path:
+    sys.path.append(COMMON_DIR)
+
+# pylint: disable=wrong-import-position,wrong-import-order,import-error
+from compressed_input import open_text, strip_compression_suffix
+from results_io import results_lock, write_atomic
+# pylint: enable=wrong-import-position,wrong-import-order,import-error
+
 
 def sqrt_manual(value):
     """
@@ -197,6 +210,8 @@ def read_numbers_from_file(filepath):
     """
     Read numbers from a file, one per line.
 
+    Compressed files (gzip, bz2, xz) are decompressed on the fly.
+
     Args:
         filepath: Path to the input file
 
@@ -208,7 +223,7 @@ def read_numbers_from_file(filepath):
     total_count = 0
 
     try:
-        with open(filepath, "r", encoding="utf-8") as file:
+        with open_text(filepath) as file:
             for line_num, line in enumerate(file, 1):
                 line = line.strip()
                 if not line:
@@ -485,17 +500,17 @@ def _format_stats_values(stats, elapsed_time):
 
 
 def _write_table_to_file(output_file, labels, columns):
-    """Write the statistics table to file."""
+    """Write the statistics table to file (atomically, via rename)."""
     col_names = list(columns.keys())
+    lines = ["\t" + "\t".join(col_names) + "\n"]
+    for i, label in enumerate(labels):
+        row_values = [
+            columns[col][i] if i < len(columns[col]) else ""
+            for col in col_names
+        ]
+        lines.append(label + "\t" + "\t".join(row_values) + "\n")
     try:
-        with open(output_file, "w", encoding="utf-8") as file:
-            file.write("\t" + "\t".join(col_names) + "\n")
-            for i, label in enumerate(labels):
-                row_values = [
-                    columns[col][i] if i < len(columns[col]) else ""
-                    for col in col_names
-                ]
-                file.write(label + "\t" + "\t".join(row_values) + "\n")
+        write_atomic(output_file, "".join(lines))
     except IOError as io_error:
         print(f"Error: No se pudo escribir el archivo de resultados: {io_error}")
 
@@ -505,7 +520,8 @@ def write_results(stats, elapsed_time, input_filename):
     Write results to StatisticsResults.txt file in tabular format.
 
     If file exists, adds a new column with the results.
-    Column is named after the input filename.
+    Column is named after the input filename. The read-modify-write is
+    done under a file lock so parallel runs do not lose columns.
 
     Args:
         stats: Dictionary with computed statistics
@@ -513,15 +529,17 @@ def write_results(stats, elapsed_time, input_filename):
         input_filename: Name of the input file (used as column header)
     """
     output_file = "StatisticsResults.txt"
-    col_name = get_filename(input_filename).replace(".txt", "")
+    col_name = get_filename(strip_compression_suffix(input_filename))
+    col_name = col_name.replace(".txt", "")
 
-    existing_labels, existing_columns = read_existing_results(output_file)
+    with results_lock(output_file):
+        existing_labels, existing_columns = read_existing_results(output_file)
 
-    if len(existing_labels) == 0:
-        existing_labels = _get_row_labels()
+        if len(existing_labels) == 0:
+            existing_labels = _get_row_labels()
 
-    existing_columns[col_name] = _format_stats_values(stats, elapsed_time)
-    _write_table_to_file(output_file, existing_labels, existing_columns)
+        existing_columns[col_name] = _format_stats_values(stats, elapsed_time)
+        _write_table_to_file(output_file, existing_labels, existing_columns)
 
 
 def print_results(stats, elapsed_time):
@@ -4,13 +4,44 @@ Programa para convertir números enteros a binario y hexadecimal.
 Actividad 4.2 - TC4017 Calidad de Software
 Tecnológico de Monterrey
 
-Uso: python convert_numbers.py archivoConDatos.txt
+Uso: python convert_numbers.py archivoConDatos.txt [--no-numpy]
+
+Si NumPy está instalado las conversiones se hacen en bloque; --no-numpy
+usa solo la implementación en Python puro (mismo resultado).
 """
 
 import sys
 import time
 import os
 
+# Carpeta con el código compartido entre P1, P2 y P3
+COMMON_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "common")
+if COMMON_DIR not in sys.path:
+    sys.path.append(COMMON_DIR)
+
+# pylint: disable=wrong-import-position,wrong-import-order,import-error
+from compressed_input import open_text, strip_compression_suffix
+from results_io import append_block
+# pylint: enable=wrong-import-position,wrong-import-order,import-error
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Rango que el backend vectorizado reproduce exactamente: positivos que
+# caben en int64 y negativos cuyo complemento a 2 ocupa los 32 bits.
+VECTOR_MIN = -(1 << 31)
+VECTOR_MAX = (1 << 63) - 1
+BIN_WIDTH = 63
+HEX_WIDTH = 16
+# Valores por bloque: acota los buffers intermedios (~600 bytes por valor)
+VECTOR_CHUNK = 1 << 16
+
+USAGE = "Uso: python convert_numbers.py archivoConDatos.txt [--no-numpy]"
+
 
 def int_to_binary(number):
     """
@@ -84,9 +115,112 @@ def convert_number(number):
     return binary_result, hex_result
 
 
+def _render_digits(values, base_bits, width, table):
+    """
+    Genera una matriz de bytes con los dígitos de cada valor.
+
+    Args:
+        values: Arreglo int64 de valores no negativos
+        base_bits: Bits por dígito (1 para binario, 4 para hexadecimal)
+        width: Número de dígitos por fila
+        table: Tabla de búsqueda de bytes (dígito -> carácter ASCII)
+
+    Returns:
+        Matriz uint8 de forma (len(values), width) con los caracteres
+    """
+    shifts = np.arange(width - 1, -1, -1, dtype=np.int64) * base_bits
+    digits = (values[:, None] >> shifts) & ((1 << base_bits) - 1)
+    return table[digits]
+
+
+def _first_significant(buffer):
+    """Índice del primer dígito distinto de '0' en cada fila (o el último)."""
+    significant = buffer != ord('0')
+    first = np.argmax(significant, axis=1)
+    first[~significant.any(axis=1)] = buffer.shape[1] - 1
+    return first
+
+
+def _decode_rows(buffer, starts):
+    """Convierte cada fila del buffer a string a partir de su índice inicial."""
+    width = buffer.shape[1]
+    data = buffer.tobytes()
+    return [
+        data[row * width + int(start):(row + 1) * width].decode('ascii')
+        for row, start in enumerate(starts)
+    ]
+
+
+def _convert_chunk(values):
+    """
+    Convierte con NumPy un bloque de enteros dentro del rango vectorizado.
+
+    Args:
+        values: Lista de enteros en [VECTOR_MIN, VECTOR_MAX]
+
+    Returns:
+        Lista de tuplas (binary, hex)
+    """
+    array = np.array(values, dtype=np.int64)
+    negative = array < 0
+    # Complemento a 2 de 32 bits para negativos en un solo paso
+    array = np.where(negative, array + (1 << 32), array)
+
+    table = np.frombuffer(b"0123456789ABCDEF", dtype=np.uint8)
+    bin_buffer = _render_digits(array, 1, BIN_WIDTH, table)
+    hex_buffer = _render_digits(array, 4, HEX_WIDTH, table)
+
+    binaries = _decode_rows(
+        bin_buffer,
+        np.where(negative, BIN_WIDTH - 10, _first_significant(bin_buffer)))
+    hexvals = _decode_rows(
+        hex_buffer,
+        np.where(negative, HEX_WIDTH - 2, _first_significant(hex_buffer)))
+
+    return [
+        (binary, "FFFFFFFF" + hexval if is_negative else hexval)
+        for binary, hexval, is_negative in zip(binaries, hexvals, negative)
+    ]
+
+
+def convert_numbers_vectorized(values, use_numpy=True):
+    """
+    Convierte una lista de enteros a binario y hexadecimal en bloque.
+
+    Usa NumPy para los valores dentro de [VECTOR_MIN, VECTOR_MAX], en
+    bloques de VECTOR_CHUNK valores, y recurre a convert_number para el
+    resto, o para todos si NumPy no está instalado o use_numpy es False.
+    El resultado es idéntico al de convert_number.
+
+    Args:
+        values: Lista de números enteros
+        use_numpy: Si es False, no usa el backend vectorizado
+
+    Returns:
+        Lista de tuplas (binary, hex) en el mismo orden de entrada
+    """
+    if np is None or not use_numpy:
+        return [convert_number(value) for value in values]
+
+    results = [None] * len(values)
+    indices = []
+    for i, value in enumerate(values):
+        if VECTOR_MIN <= value <= VECTOR_MAX:
+            indices.append(i)
+        else:
+            results[i] = convert_number(value)
+
+    for start in range(0, len(indices), VECTOR_CHUNK):
+        chunk = indices[start:start + VECTOR_CHUNK]
+        converted = _convert_chunk([values[i] for i in chunk])
+        for i, pair in zip(chunk, converted):
+            results[i] = pair
+    return results
+
+
 def read_numbers_from_file(filepath):
     """
-    Lee números de un archivo de texto.
+    Lee números de un archivo de texto (acepta gzip, bz2 y xz).
 
     Args:
         filepath: Ruta al archivo
@@ -95,22 +229,26 @@ def read_numbers_from_file(filepath):
         Lista de tuplas (valor_original, numero_o_none, es_valido)
     """
     numbers = []
-    with open(filepath, 'r', encoding='utf-8') as file:
-        for line in file:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                num = int(line)
-                numbers.append((line, num, True))
-            except ValueError:
-                numbers.append((line, None, False))
+    try:
+        with open_text(filepath) as file:
+            for line in file:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    num = int(line)
+                    numbers.append((line, num, True))
+                except ValueError:
+                    numbers.append((line, None, False))
+    except OSError as io_error:
+        print(f"Error: No se pudo leer el archivo: {io_error}")
+        sys.exit(1)
     return numbers
 
 
 def get_filename_without_extension(filepath):
-    """Extrae el nombre del archivo sin extensión."""
-    basename = os.path.basename(filepath)
+    """Extrae el nombre del archivo sin extensión (ni la de compresión)."""
+    basename = os.path.basename(strip_compression_suffix(filepath))
     name, _ = os.path.splitext(basename)
     return name
 
@@ -151,42 +289,46 @@ def write_results(data, filename, elapsed_time, output_path):
         result_lines.append(f"{i}\t{value}\t{binary}\t{hexval}\n")
     result_lines.append(f"TIEMPO\t{elapsed_time:.3f}s\n")
 
-    if os.path.exists(output_path):
-        # Agregar resultados debajo del contenido existente
-        with open(output_path, 'a', encoding='utf-8') as file:
-            file.write("\n\n")  # Líneas en blanco para separar
-            file.writelines(result_lines)
-    else:
-        # Crear archivo nuevo
-        with open(output_path, 'w', encoding='utf-8') as file:
-            file.writelines(result_lines)
+    # Agregar el bloque completo con candado (seguro entre procesos)
+    append_block(output_path, result_lines)
 
 
 def _get_input_filepath():
-    """Obtiene y valida la ruta del archivo de entrada."""
-    if len(sys.argv) < 2:
-        print("Uso: python convert_numbers.py archivoConDatos.txt")
+    """
+    Obtiene y valida la ruta del archivo de entrada.
+
+    Returns:
+        Tupla (input_path, use_numpy)
+    """
+    args = sys.argv[1:]
+    use_numpy = '--no-numpy' not in args
+    args = [arg for arg in args if arg != '--no-numpy']
+    if len(args) < 1:
+        print(USAGE)
         sys.exit(1)
-    input_path = sys.argv[1]
+    input_path = args[0]
     if not os.path.exists(input_path):
         print(f"Error: Archivo no encontrado: {input_path}")
         sys.exit(1)
-    return input_path
+    return input_path, use_numpy
 
 
 def main():
     """Función principal del programa."""
-    filepath = _get_input_filepath()
+    filepath, use_numpy = _get_input_filepath()
     start_time = time.time()
 
     # Leer números del archivo
     numbers = read_numbers_from_file(filepath)
 
-    # Convertir cada número
+    # Convertir en bloque todos los números válidos
+    converted = iter(convert_numbers_vectorized(
+        [num for _, num, is_valid in numbers if is_valid], use_numpy))
+
     results = []
     for i, (original, num, is_valid) in enumerate(numbers, 1):
         if is_valid:
-            binary, hexval = convert_number(num)
+            binary, hexval = next(converted)
             results.append((original, binary, hexval))
         else:
             print(f"Error: Dato inválido '{original}' en la línea {i}")
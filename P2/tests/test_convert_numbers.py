@@ -0,0 +1,89 @@
+"""
+Pruebas de equivalencia del backend vectorizado de convert_numbers.py.
+
+Actividad 4.2 - TC4017 Calidad de Software
+Tecnológico de Monterrey
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(TESTS_DIR), "source"))
+
+import convert_numbers  # pylint: disable=wrong-import-position,import-error
+
+TEST_CASES = ("TC1", "TC2", "TC3", "TC4")
+
+EDGE_VALUES = [
+    0, 1, 2, 255, 511, 512, -1, -2, -255, -256, -512, -513,
+    (1 << 63) - 1, 1 << 63, 10 ** 30,
+    -(1 << 31), -(1 << 31) - 1, -(1 << 32), -(1 << 32) + 5, -(1 << 40),
+    -(10 ** 30),
+]
+
+
+def _valid_numbers(test_case):
+    """Enteros válidos de un archivo de prueba de P2."""
+    path = os.path.join(TESTS_DIR, f"{test_case}.txt")
+    return [number for _, number, is_valid
+            in convert_numbers.read_numbers_from_file(path) if is_valid]
+
+
+def _expected(values):
+    """Resultado de referencia: convert_number valor por valor."""
+    return [convert_numbers.convert_number(value) for value in values]
+
+
+class VectorizedBackendTest(unittest.TestCase):
+    """convert_numbers_vectorized produce lo mismo que convert_number."""
+
+    def test_test_cases(self):
+        """Equivalencia sobre P2/tests/TC1-TC4."""
+        for test_case in TEST_CASES:
+            with self.subTest(test_case=test_case):
+                values = _valid_numbers(test_case)
+                self.assertEqual(
+                    convert_numbers.convert_numbers_vectorized(values),
+                    _expected(values))
+
+    def test_edge_values(self):
+        """Límites del rango vectorizado y valores fuera de él."""
+        self.assertEqual(
+            convert_numbers.convert_numbers_vectorized(EDGE_VALUES),
+            _expected(EDGE_VALUES))
+
+    def test_chunk_boundaries(self):
+        """El resultado no depende del tamaño de bloque."""
+        values = EDGE_VALUES + _valid_numbers("TC4")
+        with mock.patch.object(convert_numbers, "VECTOR_CHUNK", 7):
+            self.assertEqual(
+                convert_numbers.convert_numbers_vectorized(values),
+                _expected(values))
+
+    def test_without_numpy(self):
+        """Con np = None se usa el camino en Python puro."""
+        values = EDGE_VALUES + _valid_numbers("TC3")
+        with mock.patch.object(convert_numbers, "np", None):
+            self.assertEqual(
+                convert_numbers.convert_numbers_vectorized(values),
+                _expected(values))
+
+    def test_opt_out(self):
+        """use_numpy=False no llama al backend vectorizado."""
+        values = _valid_numbers("TC4")
+        with mock.patch.object(convert_numbers, "_convert_chunk") as chunk:
+            result = convert_numbers.convert_numbers_vectorized(
+                values, use_numpy=False)
+        chunk.assert_not_called()
+        self.assertEqual(result, _expected(values))
+
+    def test_empty(self):
+        """Una lista vacía produce una lista vacía."""
+        self.assertEqual(convert_numbers.convert_numbers_vectorized([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,190 @@
+"""
+Sketches de memoria fija para el conteo aproximado de palabras.
+
+Actividad 4.2 - TC4017 Calidad de Software
+Tecnológico de Monterrey
+
+Incluye Count-Min (frecuencias), Space-Saving (palabras más frecuentes)
+y HyperLogLog (palabras distintas). Todos se pueden combinar con merge,
+así que los sketches de varios archivos se suman sin releer los datos.
+"""
+
+from array import array
+import hashlib
+import heapq
+import math
+
+# Parámetros por omisión (memoria fija)
+SKETCH_WIDTH = 4096
+SKETCH_DEPTH = 4
+SKETCH_CAPACITY = 1000
+HLL_PRECISION = 12
+
+
+def hash64(word):
+    """Hash de 64 bits estable entre procesos (para sketches combinables)."""
+    digest = hashlib.blake2b(word.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+class CountMinSketch:
+    """
+    Sketch Count-Min para estimar frecuencias en memoria fija.
+
+    Cada estimación sobreestima el conteo real en a lo más
+    epsilon * total con probabilidad 1 - delta.
+    """
+
+    def __init__(self, width=SKETCH_WIDTH, depth=SKETCH_DEPTH):
+        self.width = width
+        self.depth = depth
+        self.rows = [array('q', [0]) * width for _ in range(depth)]
+        self.total = 0
+
+    def _columns(self, hashed):
+        """Columna de cada fila por doble hashing (h1 + i * h2)."""
+        low = hashed & 0xFFFFFFFF
+        high = (hashed >> 32) | 1
+        return [(low + i * high) % self.width for i in range(self.depth)]
+
+    def add(self, hashed, count=1):
+        """Suma count a la palabra con hash hashed."""
+        for row, column in zip(self.rows, self._columns(hashed)):
+            row[column] += count
+        self.total += count
+
+    def estimate(self, hashed):
+        """Estimación (cota superior) del conteo de una palabra."""
+        return min(row[column]
+                   for row, column in zip(self.rows, self._columns(hashed)))
+
+    def error_bound(self):
+        """Tupla (error absoluto máximo, probabilidad de cumplirlo)."""
+        epsilon = math.e / self.width
+        delta = math.exp(-self.depth)
+        return epsilon * self.total, 1 - delta
+
+    def merge(self, other):
+        """Combina otro sketch con las mismas dimensiones."""
+        for row, other_row in zip(self.rows, other.rows):
+            for column, count in enumerate(other_row):
+                row[column] += count
+        self.total += other.total
+
+
+class SpaceSaving:
+    """
+    Lista de palabras frecuentes (heavy hitters) con el algoritmo
+    Space-Saving.
+
+    Conserva a lo más capacity palabras; cuando está llena reemplaza a la
+    de menor conteo y hereda ese conteo como error. Toda palabra con más
+    de total / capacity apariciones está garantizada en la lista.
+    """
+
+    def __init__(self, capacity=SKETCH_CAPACITY):
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        self.heap = []
+
+    def _pop_minimum(self):
+        """Extrae la palabra de menor conteo (descarta entradas viejas)."""
+        while True:
+            count, word = heapq.heappop(self.heap)
+            if self.counts.get(word) == count:
+                return word, count
+
+    def add(self, word, count=1):
+        """Suma count apariciones de word."""
+        if word in self.counts:
+            self.counts[word] += count
+        elif len(self.counts) < self.capacity:
+            self.counts[word] = count
+            self.errors[word] = 0
+        else:
+            evicted, minimum = self._pop_minimum()
+            del self.counts[evicted]
+            del self.errors[evicted]
+            self.counts[word] = minimum + count
+            self.errors[word] = minimum
+        heapq.heappush(self.heap, (self.counts[word], word))
+
+        # Reconstruir el heap si acumula demasiadas entradas viejas
+        if len(self.heap) > 4 * self.capacity:
+            self.heap = [(count, item) for item, count in self.counts.items()]
+            heapq.heapify(self.heap)
+
+    def _floor(self):
+        """Conteo máximo posible de una palabra que no está en la lista."""
+        if len(self.counts) < self.capacity:
+            return 0
+        return min(self.counts.values())
+
+    def merge(self, other):
+        """
+        Combina otra lista Space-Saving (conteos y errores se suman).
+
+        Una palabra ausente de una lista llena pudo aparecer hasta el
+        conteo mínimo de esa lista, así que se suma ese mínimo como
+        conteo y como error; después se conservan las capacity palabras
+        de mayor conteo. Así el conteo sigue siendo una cota superior y
+        conteo - error una cota inferior del conteo real.
+        """
+        own_floor = self._floor()
+        other_floor = other._floor()  # pylint: disable=protected-access
+        counts = {}
+        errors = {}
+        for word in self.counts.keys() | other.counts.keys():
+            counts[word] = (self.counts.get(word, own_floor)
+                            + other.counts.get(word, other_floor))
+            errors[word] = (self.errors.get(word, own_floor)
+                            + other.errors.get(word, other_floor))
+        kept = heapq.nlargest(self.capacity, counts, key=counts.get)
+        self.counts = {word: counts[word] for word in kept}
+        self.errors = {word: errors[word] for word in kept}
+        self.heap = [(count, word) for word, count in self.counts.items()]
+        heapq.heapify(self.heap)
+
+
+class HyperLogLog:
+    """
+    Estimador HyperLogLog del número de palabras distintas.
+
+    Usa 2 ** precision registros de un byte; el error estándar relativo
+    es 1.04 / sqrt(2 ** precision).
+    """
+
+    def __init__(self, precision=HLL_PRECISION):
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, hashed):
+        """Registra una palabra con hash hashed."""
+        index = hashed >> (64 - self.precision)
+        rest = hashed & ((1 << (64 - self.precision)) - 1)
+        rank = (64 - self.precision) - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def estimate(self):
+        """Número estimado de palabras distintas."""
+        size = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        raw = alpha * size * size / sum(2.0 ** -rank
+                                        for rank in self.registers)
+        zeros = self.registers.count(0)
+        if raw <= 2.5 * size and zeros:
+            # Corrección para cardinalidades pequeñas (linear counting)
+            return round(size * math.log(size / zeros))
+        return round(raw)
+
+    def relative_error(self):
+        """Error estándar relativo del estimador."""
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def merge(self, other):
+        """Combina otro HyperLogLog con la misma precisión."""
+        for index, rank in enumerate(other.registers):
+            if rank > self.registers[index]:
+                self.registers[index] = rank
@@ -0,0 +1,121 @@
+"""
+Particiones en disco para el conteo de palabras con memoria acotada.
+
+Actividad 4.2 - TC4017 Calidad de Software
+Tecnológico de Monterrey
+
+Cada archivo de partición o de corrida guarda una línea por palabra con
+el conteo y la palabra separados por un tabulador; la palabra va al
+final porque puede contener tabuladores.
+"""
+
+import os
+import zlib
+
+# Número de particiones hash para el modo de memoria externa
+SPILL_PARTITIONS = 16
+PARTITION_BITS = 4
+
+
+def _partition_of(word, level=0):
+    """
+    Partición hash (estable entre ejecuciones) de una palabra.
+
+    Cada nivel de re-partición toma otros bits del CRC32 para que las
+    palabras de una partición demasiado grande se repartan de nuevo.
+    """
+    crc = zlib.crc32(word.encode('utf-8'))
+    return (crc >> (PARTITION_BITS * level)) % SPILL_PARTITIONS
+
+
+def spill_counts(counts, spill_dir):
+    """Agrega los conteos parciales a los archivos de partición en disco."""
+    partitions = [[] for _ in range(SPILL_PARTITIONS)]
+    for word, count in counts.items():
+        partitions[_partition_of(word)].append(f"{count}\t{word}\n")
+
+    for index, lines in enumerate(partitions):
+        if lines:
+            path = os.path.join(spill_dir, f"part{index}.txt")
+            with open(path, 'a', encoding='utf-8') as file:
+                file.writelines(lines)
+
+
+def merge_partition(path, memory_budget=None):
+    """
+    Combina todos los derrames de una partición en un solo diccionario.
+
+    Args:
+        path: Archivo de la partición
+        memory_budget: Máximo de palabras distintas; None para no acotar
+
+    Returns:
+        Diccionario palabra -> conteo, o None si la partición tiene más
+        de memory_budget palabras distintas
+    """
+    counts = {}
+    for word, count in read_ranked_run(path):
+        if word in counts:
+            counts[word] = counts[word] + count
+        elif memory_budget is not None and len(counts) >= memory_budget:
+            return None
+        else:
+            counts[word] = count
+    return counts
+
+
+def split_partition(path, level):
+    """
+    Reparte una partición en SPILL_PARTITIONS sub-particiones.
+
+    Returns:
+        Lista con las rutas de las sub-particiones no vacías
+    """
+    base, _ = os.path.splitext(path)
+    paths = [f"{base}.{index}.txt" for index in range(SPILL_PARTITIONS)]
+    files = [None] * SPILL_PARTITIONS
+    try:
+        with open(path, 'r', encoding='utf-8') as source:
+            for line in source:
+                word = line.rstrip('\n').split('\t', 1)[1]
+                index = _partition_of(word, level)
+                if files[index] is None:
+                    files[index] = open(  # pylint: disable=consider-using-with
+                        paths[index], 'w', encoding='utf-8')
+                files[index].write(line)
+    finally:
+        for file in files:
+            if file is not None:
+                file.close()
+    return [paths[index] for index in range(SPILL_PARTITIONS)
+            if files[index] is not None]
+
+
+def read_ranked_run(path):
+    """Genera las tuplas (palabra, conteo) de un archivo ordenado."""
+    with open(path, 'r', encoding='utf-8') as file:
+        for line in file:
+            count, word = line.rstrip('\n').split('\t', 1)
+            yield word, int(count)
+
+
+def write_ranked_run(path, ranked):
+    """Escribe tuplas (palabra, conteo) ordenadas en un archivo de corrida."""
+    with open(path, 'w', encoding='utf-8') as file:
+        for word, count in ranked:
+            file.write(f"{count}\t{word}\n")
+
+
+class RankedFile:  # pylint: disable=too-few-public-methods
+    """
+    Ranking final guardado en disco.
+
+    Se puede recorrer varias veces (consola y archivo de resultados) sin
+    cargar el vocabulario completo en memoria.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def __iter__(self):
+        return read_ranked_run(self.path)
@@ -0,0 +1,102 @@
+"""
+Almacenamiento compacto del vocabulario para el conteo de palabras.
+
+Actividad 4.2 - TC4017 Calidad de Software
+Tecnológico de Monterrey
+"""
+
+from array import array
+
+
+class CompactVocabulary:
+    """
+    Vocabulario compacto para conteos con muchas palabras distintas.
+
+    Los bytes UTF-8 de todas las palabras viven contiguos en un arena
+    (bytearray); un índice hash de direccionamiento abierto apunta a su
+    identificador, y los conteos y primeras posiciones se guardan en
+    columnas array('q') paralelas. Cuesta entre 40 y 56 bytes por palabra
+    (según el llenado de la tabla hash) más su texto, en lugar de un str
+    y entradas en dos diccionarios.
+    """
+
+    def __init__(self, capacity=1024):
+        self.arena = bytearray()
+        self.offsets = array('q', [0])
+        self.counts = array('q')
+        self.first_position = array('q')
+        self.slots = array('q', [-1]) * capacity
+
+    def __len__(self):
+        return len(self.counts)
+
+    def _find_slot(self, data):
+        """Retorna el slot de data: el que la contiene o uno vacío."""
+        mask = len(self.slots) - 1
+        slot = hash(data) & mask
+        while True:
+            index = self.slots[slot]
+            if index == -1 or self.word_bytes(index) == data:
+                return slot
+            slot = (slot + 1) & mask
+
+    def _grow(self):
+        """Duplica la tabla hash y reinserta los identificadores."""
+        self.slots = array('q', [-1]) * (len(self.slots) * 2)
+        for index in range(len(self.counts)):
+            self.slots[self._find_slot(self.word_bytes(index))] = index
+
+    def add(self, word, position):
+        """
+        Suma una aparición de word.
+
+        Args:
+            word: Palabra a contar
+            position: Línea de la aparición (se guarda solo la primera)
+        """
+        data = word.encode('utf-8')
+        slot = self._find_slot(data)
+        index = self.slots[slot]
+        if index != -1:
+            self.counts[index] += 1
+            return
+
+        self.slots[slot] = len(self.counts)
+        self.arena += data
+        self.offsets.append(len(self.arena))
+        self.counts.append(1)
+        self.first_position.append(position)
+        # Mantener el factor de carga en 1/2 o menos
+        if len(self.counts) * 2 > len(self.slots):
+            self._grow()
+
+    def word_bytes(self, index):
+        """Bytes UTF-8 de la palabra con identificador index."""
+        return bytes(self.arena[self.offsets[index]:self.offsets[index + 1]])
+
+    def word(self, index):
+        """Palabra con identificador index."""
+        return self.word_bytes(index).decode('utf-8')
+
+    def items(self):
+        """Genera las tuplas (palabra, conteo) en orden de inserción."""
+        for index, count in enumerate(self.counts):
+            yield self.word(index), count
+
+
+class RankedVocabulary:  # pylint: disable=too-few-public-methods
+    """
+    Ranking de un CompactVocabulary como columna de identificadores.
+
+    Decodifica cada palabra solo al recorrerlo, así que se puede iterar
+    varias veces sin materializar una lista de tuplas.
+    """
+
+    def __init__(self, vocabulary, order):
+        self.vocabulary = vocabulary
+        self.order = order
+
+    def __iter__(self):
+        counts = self.vocabulary.counts
+        for index in self.order:
+            yield self.vocabulary.word(index), counts[index]
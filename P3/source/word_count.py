@@ -4,114 +4,726 @@ Programa para contar palabras distintas y sus frecuencias.
 Actividad 4.2 - TC4017 Calidad de Software
 Tecnológico de Monterrey
 
-Uso: python wordCount.py archivoConDatos.txt
+Uso: python wordCount.py archivoConDatos.txt [...] [--top K] [--workers N]
+                        [--memory-budget PALABRAS] [--compact] [--sketch]
+                        [--tokenize] [--casefold] [--strip-punct]
+
+Con varios archivos se genera una sola tabla con una columna por archivo
+y una columna Grand Total con el conteo combinado; --memory-budget,
+--compact y --sketch solo aplican a un archivo.
+
+--tokenize trata cada línea como texto libre y cuenta sus palabras.
+--casefold y --strip-punct activan también --tokenize: las líneas sin
+palabras ya no se reportan como vacías (ni aparece "(blank)") y Grand
+Total pasa a ser el número de palabras, no de líneas.
 """
 
+from array import array
+import heapq
+import itertools
+import math
+import multiprocessing
+import re
 import sys
+import tempfile
 import time
 import os
 
+from sketches import (
+    SKETCH_CAPACITY, CountMinSketch, HyperLogLog, SpaceSaving, hash64
+)
+from spill import (
+    SPILL_PARTITIONS, RankedFile, merge_partition, read_ranked_run,
+    spill_counts, split_partition, write_ranked_run
+)
+from vocabulary import CompactVocabulary, RankedVocabulary
+
+# Carpeta con el código compartido entre P1, P2 y P3
+COMMON_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "common")
+if COMMON_DIR not in sys.path:
+    sys.path.append(COMMON_DIR)
+
+# pylint: disable=wrong-import-position,wrong-import-order,import-error
+from compressed_input import (
+    detect_compression, open_text, strip_compression_suffix
+)
+from results_io import append_block
+# pylint: enable=wrong-import-position,wrong-import-order,import-error
+
+USAGE = ("Uso: python word_count.py archivoConDatos.txt [...] "
+         "[--top K] [--workers N] [--memory-budget PALABRAS] [--compact] "
+         "[--sketch] [--tokenize] [--casefold] [--strip-punct]")
+
+# Opciones de línea de comandos que reciben un entero positivo
+INT_OPTIONS = {
+    '--top': 'top',
+    '--workers': 'workers',
+    '--memory-budget': 'memory_budget'
+}
+
+# Opciones de línea de comandos sin valor
+FLAG_OPTIONS = {
+    '--compact': 'compact',
+    '--sketch': 'sketch',
+    '--tokenize': 'tokenize',
+    '--casefold': 'casefold',
+    '--strip-punct': 'strip_punct'
+}
+
+# Opciones que solo aplican al conteo de un solo archivo
+SINGLE_FILE_OPTIONS = ('memory_budget', 'compact', 'sketch')
+
+# Patrones del modo de texto libre: cualquier secuencia sin espacios, o
+# solo letras/dígitos (conservando contracciones y guiones internos)
+TOKEN_PATTERN = re.compile(r"\S+")
+WORD_PATTERN = re.compile(r"\w+(?:['’-]\w+)*")
+
+OUTPUT_PATH = "WordCountResults.txt"
+
+# Palabras por lote al ordenar una cubeta de CompactVocabulary
+SORT_BATCH = 1 << 16
+# Re-particiones máximas de una partición que no cabe en el presupuesto
+MAX_SPLIT_LEVEL = 4
+
 
 def read_words_from_file(filepath):
     """
-    Lee palabras de un archivo de texto (una por línea).
+    Lee palabras de un archivo de texto (una por línea) sin cargarlo
+    completo en memoria. Acepta archivos comprimidos con gzip, bz2 o xz.
 
     Args:
         filepath: Ruta al archivo
 
-    Returns:
-        Lista de palabras (strings), incluyendo líneas vacías como ''
+    Yields:
+        Cada palabra (string), incluyendo líneas vacías como ''
     """
-    words = []
-    with open(filepath, 'r', encoding='utf-8') as file:
+    with open_text(filepath) as file:
         for line in file:
-            word = line.strip()
-            words.append(word)
+            yield line.strip()
+
+
+def tokenize_words(lines, casefold=False, strip_punct=False):
+    """
+    Separa líneas de texto libre en palabras en el mismo recorrido.
+
+    Usa patrones precompilados y genera cada palabra directamente, sin
+    construir listas por línea. Las líneas sin palabras no se reportan.
+
+    Args:
+        lines: Iterable de líneas de texto
+        casefold: Si es True, ignora mayúsculas/minúsculas
+        strip_punct: Si es True, descarta la puntuación
+
+    Yields:
+        Cada palabra encontrada
+    """
+    pattern = WORD_PATTERN if strip_punct else TOKEN_PATTERN
+    for line in lines:
+        if casefold:
+            line = line.casefold()
+        for match in pattern.finditer(line):
+            yield match.group()
+
+
+def _tokenizer_of(options):
+    """
+    Parámetros de tokenize_words según las opciones, o None.
+
+    --casefold y --strip-punct solo tienen sentido sobre texto libre,
+    así que cualquiera de ellas activa el modo --tokenize.
+    """
+    if options['tokenize'] or options['casefold'] or options['strip_punct']:
+        return options['casefold'], options['strip_punct']
+    return None
+
+
+def _word_source(filepath, options):
+    """Palabras del archivo: una por línea o tokenizadas."""
+    words = read_words_from_file(filepath)
+    tokenizer = _tokenizer_of(options)
+    if tokenizer is not None:
+        words = tokenize_words(words, *tokenizer)
     return words
 
 
-def count_words(words):
+def _report_blank(line_num):
+    """Reporta una línea vacía en consola."""
+    print(f"Error: Línea vacía en la línea {line_num}")
+
+
+def count_words(words, on_blank=_report_blank):
     """
     Cuenta la frecuencia de cada palabra usando algoritmo básico.
     NO usa Counter ni funciones de biblioteca.
 
+    Consume las palabras en flujo: la memoria depende del vocabulario y
+    no del tamaño de la entrada.
+
     Args:
-        words: Lista de palabras
+        words: Iterable de palabras
+        on_blank: Función llamada con el número de cada línea vacía
 
     Returns:
-        Tupla (word_counts, blank_count) donde:
-        - word_counts: Lista de tuplas (palabra, conteo, primera_posicion)
+        Diccionario con:
+        - counts: palabra -> conteo
+        - first_position: palabra -> primera línea donde aparece
         - blank_count: Número de líneas vacías
+        - total_words: Número total de líneas leídas
     """
     # Diccionario manual para conteo
     counts = {}
     first_position = {}
     blank_count = 0
+    total_words = 0
 
-    for i, word in enumerate(words, 1):
+    for word in words:
+        total_words += 1
         if word == '':
-            print(f"Error: Línea vacía en la línea {i}")
+            on_blank(total_words)
             blank_count += 1
+        elif word in counts:
+            counts[word] = counts[word] + 1
         else:
-            if word in counts:
-                counts[word] = counts[word] + 1
-            else:
-                counts[word] = 1
-                first_position[word] = i
-
-    # Convertir a lista de tuplas
-    word_counts = []
-    for word, count in counts.items():
-        word_counts.append((word, count, first_position[word]))
+            counts[word] = 1
+            first_position[word] = total_words
+
+    return {
+        'counts': counts,
+        'first_position': first_position,
+        'blank_count': blank_count,
+        'total_words': total_words
+    }
+
+
+def _find_chunk_bounds(filepath, workers):
+    """
+    Divide el archivo en rangos de bytes que empiezan al inicio de línea.
+
+    Los cortes se hacen solo después de un \\n, que siempre termina una
+    línea (también en \\r\\n). Un archivo que usa solo \\r como fin de
+    línea queda en un único rango.
+
+    Args:
+        filepath: Ruta al archivo
+        workers: Número de partes deseadas
+
+    Returns:
+        Lista de tuplas (inicio, fin) en bytes, sin rangos vacíos
+    """
+    size = os.path.getsize(filepath)
+    starts = [0]
+    with open(filepath, 'rb') as file:
+        for i in range(1, workers):
+            file.seek(size * i // workers)
+            file.readline()
+            position = file.tell()
+            if starts[-1] < position < size:
+                starts.append(position)
+    ends = starts[1:] + [size]
+    return list(zip(starts, ends))
+
+
+def _split_newlines(line):
+    """
+    Separa una línea binaria leída con readline como lo hace el modo texto.
+
+    readline solo corta en \\n; igual que los saltos de línea universales
+    de open(), un \\r suelto también termina una línea.
+
+    Returns:
+        Lista de líneas sin su terminador
+    """
+    text = line.decode('utf-8')
+    if text.endswith('\n'):
+        text = text[:-1]
+    if text.endswith('\r'):
+        text = text[:-1]
+    if '\r' in text:
+        return text.split('\r')
+    return [text]
+
+
+def _read_chunk(filepath, start, end):
+    """Genera las palabras de las líneas entre los bytes start y end."""
+    with open(filepath, 'rb') as file:
+        file.seek(start)
+        while file.tell() < end:
+            line = file.readline()
+            if not line:
+                break
+            for text in _split_newlines(line):
+                yield text.strip()
+
+
+def _count_chunk(task):
+    """
+    Cuenta las palabras de un rango del archivo (ejecutado en un worker).
+
+    Las posiciones y líneas vacías son locales al rango; el proceso
+    padre las desplaza al número de línea global. Si start es None se
+    lee el archivo completo (admite archivos comprimidos).
+    """
+    filepath, start, end, tokenizer = task
+    if start is None:
+        words = read_words_from_file(filepath)
+    else:
+        words = _read_chunk(filepath, start, end)
+    if tokenizer is not None:
+        words = tokenize_words(words, *tokenizer)
+    blank_lines = []
+    tally = count_words(words, blank_lines.append)
+    tally['blank_lines'] = blank_lines
+    return tally
+
+
+def _shift_tally(tally, offset):
+    """Desplaza las posiciones de un conteo parcial por offset líneas."""
+    first_position = tally['first_position']
+    for word in first_position:
+        first_position[word] = first_position[word] + offset
+    tally['blank_lines'] = [line + offset for line in tally['blank_lines']]
+    return tally
+
+
+def _merge_tallies(left, right):
+    """
+    Combina dos conteos parciales consecutivos (left precede a right).
+
+    Returns:
+        Conteo combinado (reutiliza el diccionario más grande)
+    """
+    if len(right['counts']) > len(left['counts']):
+        big, small = right, left
+    else:
+        big, small = left, right
+
+    counts = big['counts']
+    first_position = big['first_position']
+    for word, count in small['counts'].items():
+        position = small['first_position'][word]
+        if word in counts:
+            counts[word] = counts[word] + count
+            first_position[word] = min(first_position[word], position)
+        else:
+            counts[word] = count
+            first_position[word] = position
+
+    return {
+        'counts': counts,
+        'first_position': first_position,
+        'blank_count': left['blank_count'] + right['blank_count'],
+        'total_words': left['total_words'] + right['total_words'],
+        'blank_lines': left['blank_lines'] + right['blank_lines']
+    }
+
+
+def count_words_parallel(filepath, workers, tokenizer=None):
+    """
+    Cuenta palabras repartiendo el archivo entre varios procesos.
+
+    El archivo se parte en límites de línea; cada worker cuenta su parte
+    y el proceso padre combina los resultados. Los mensajes de líneas
+    vacías se imprimen en el mismo orden que en la ejecución secuencial.
+
+    Args:
+        filepath: Ruta al archivo
+        workers: Número de procesos
+        tokenizer: Tupla (casefold, strip_punct) para texto libre, o None
+
+    Returns:
+        Diccionario con el mismo formato que count_words
+    """
+    if detect_compression(filepath) is not None:
+        # Los rangos de bytes no aplican al contenido comprimido
+        tasks = [(filepath, None, None, tokenizer)]
+    else:
+        tasks = [(filepath, start, end, tokenizer)
+                 for start, end in _find_chunk_bounds(filepath, workers)]
+    if not tasks:
+        return count_words([])
+
+    # Combinar en orden a medida que llegan (imap): cada conteo parcial
+    # se desplaza a números de línea globales y se funde en el acumulado,
+    # así el padre no retiene todos los vocabularios parciales a la vez
+    offset = 0
+    tally = None
+    with multiprocessing.Pool(min(workers, len(tasks))) as pool:
+        for partial in pool.imap(_count_chunk, tasks):
+            _shift_tally(partial, offset)
+            offset += partial['total_words']
+            tally = partial if tally is None else _merge_tallies(tally,
+                                                                 partial)
+
+    for line_num in tally.pop('blank_lines'):
+        _report_blank(line_num)
+    return tally
+
+
+def _report_file_blank(filename, line_num):
+    """Reporta una línea vacía indicando el archivo (modo corpus)."""
+    print(f"Error: Línea vacía en la línea {line_num} ({filename})")
+
+
+def count_corpus(filepaths, workers=1, tokenizer=None):
+    """
+    Cuenta palabras de varios archivos, leyendo cada uno una sola vez.
 
-    return word_counts, blank_count
+    Con workers > 1 cada archivo se cuenta en un proceso del pool.
 
+    Args:
+        filepaths: Lista de rutas de archivo
+        workers: Número de procesos
+        tokenizer: Tupla (casefold, strip_punct) para texto libre, o None
 
-def sort_word_counts(word_counts):
+    Returns:
+        Diccionario con:
+        - files: Lista de conteos por archivo (formato de count_words)
+        - counts: palabra -> conteo combinado de todos los archivos
+        - blank_count y total_words combinados
+    """
+    tasks = [(path, None, None, tokenizer) for path in filepaths]
+    if workers > 1 and len(tasks) > 1:
+        with multiprocessing.Pool(min(workers, len(tasks))) as pool:
+            files = pool.map(_count_chunk, tasks)
+    else:
+        files = [_count_chunk(task) for task in tasks]
+
+    counts = {}
+    for path, tally in zip(filepaths, files):
+        filename = get_filename_without_extension(path)
+        for line_num in tally.pop('blank_lines'):
+            _report_file_blank(filename, line_num)
+        for word, count in tally['counts'].items():
+            counts[word] = counts.get(word, 0) + count
+
+    return {
+        'files': files,
+        'counts': counts,
+        'blank_count': sum(tally['blank_count'] for tally in files),
+        'total_words': sum(tally['total_words'] for tally in files)
+    }
+
+
+def sort_word_counts(counts):
     """
     Ordena las palabras por frecuencia descendente, luego alfabéticamente.
-    Implementación de ordenamiento sin usar sorted() con key compleja.
+    Usa ordenamiento por cubetas (bucket sort) indexado por conteo: cada
+    palabra cae en la cubeta de su conteo en O(1), solo se ordenan los
+    conteos distintos (a lo más uno por palabra) y cada cubeta se ordena
+    alfabéticamente. El costo depende del vocabulario, no del valor de
+    los conteos.
 
     Args:
-        word_counts: Lista de tuplas (palabra, conteo, posicion)
+        counts: Diccionario palabra -> conteo
 
     Returns:
         Lista ordenada de tuplas (palabra, conteo)
     """
-    # Crear lista para ordenar
-    to_sort = []
-    for word, count, pos in word_counts:
-        to_sort.append((word, count, pos))
-
-    # Bubble sort manual (sin usar sorted con key)
-    length = len(to_sort)
-    for i in range(length):
-        for j in range(0, length - i - 1):
-            # Comparar: primero por conteo descendente, luego alfabéticamente
-            word1, count1, _ = to_sort[j]
-            word2, count2, _ = to_sort[j + 1]
-
-            should_swap = False
-            if count1 < count2:
-                should_swap = True
-            elif count1 == count2:
-                # Mismo conteo: ordenar alfabéticamente
-                if word1 > word2:
-                    should_swap = True
-
-            if should_swap:
-                to_sort[j], to_sort[j + 1] = to_sort[j + 1], to_sort[j]
-
-    # Retornar solo palabra y conteo
+    # Una cubeta por conteo presente
+    buckets = {}
+    for word, count in counts.items():
+        bucket = buckets.get(count)
+        if bucket is None:
+            buckets[count] = [word]
+        else:
+            bucket.append(word)
+
+    # Recorrer cubetas de mayor a menor conteo
     result = []
-    for word, count, pos in to_sort:
-        result.append((word, count))
+    for count in sorted(buckets, reverse=True):
+        bucket = buckets[count]
+        bucket.sort()
+        for word in bucket:
+            result.append((word, count))
     return result
 
 
+def _rank_key(word_count):
+    """Llave de orden: conteo descendente, luego palabra ascendente."""
+    return -word_count[1], word_count[0]
+
+
+def top_word_counts(counts, k):
+    """
+    Selecciona las K palabras más frecuentes con un heap de tamaño K.
+
+    Usa el mismo desempate que sort_word_counts, en O(V log K).
+
+    Args:
+        counts: Diccionario palabra -> conteo (o CompactVocabulary)
+        k: Número de palabras a conservar
+
+    Returns:
+        Lista ordenada de a lo más K tuplas (palabra, conteo)
+    """
+    return heapq.nsmallest(k, counts.items(), key=_rank_key)
+
+
+def _rank_partition(path, memory_budget, level=0):
+    """
+    Ordena una partición derramada en un archivo de corrida.
+
+    Si la partición tiene más de memory_budget palabras distintas se
+    re-parte con otra semilla y se ordena cada sub-partición por
+    separado, así ningún diccionario en memoria pasa del presupuesto.
+    Después de MAX_SPLIT_LEVEL re-particiones se combina sin límite.
+
+    Returns:
+        Ruta del archivo de corrida ordenado
+    """
+    base, _ = os.path.splitext(path)
+    run_path = f"{base}.run.txt"
+    if level >= MAX_SPLIT_LEVEL:
+        memory_budget = None
+    counts = merge_partition(path, memory_budget)
+    if counts is not None:
+        write_ranked_run(run_path, sort_word_counts(counts))
+    else:
+        sub_paths = split_partition(path, level + 1)
+        run_paths = [_rank_partition(sub_path, memory_budget, level + 1)
+                     for sub_path in sub_paths]
+        runs = [read_ranked_run(sub_run) for sub_run in run_paths]
+        write_ranked_run(run_path, heapq.merge(*runs, key=_rank_key))
+        for sub_run in run_paths:
+            os.remove(sub_run)
+    os.remove(path)
+    return run_path
+
+
+def count_words_external(words, memory_budget, spill_dir,
+                         on_blank=_report_blank):
+    """
+    Cuenta palabras con memoria acotada derramando a disco.
+
+    Cuando el diccionario alcanza memory_budget palabras distintas, los
+    conteos se agregan a archivos de partición por hash. Al final cada
+    partición se combina por separado (re-partiéndola si no cabe en el
+    presupuesto), se ordena con sort_word_counts y las corridas ordenadas
+    se mezclan (merge sort externo) en un ranking final con el mismo
+    orden que sort_word_counts.
+
+    Args:
+        words: Iterable de palabras
+        memory_budget: Máximo de palabras distintas en memoria
+        spill_dir: Directorio para los archivos temporales
+        on_blank: Función llamada con el número de cada línea vacía
+
+    Returns:
+        Diccionario con el formato de count_words, donde 'ranked' es un
+        RankedFile en lugar de los diccionarios de conteo
+    """
+    counts = {}
+    blank_count = 0
+    total_words = 0
+
+    for word in words:
+        total_words += 1
+        if word == '':
+            on_blank(total_words)
+            blank_count += 1
+        elif word in counts:
+            counts[word] = counts[word] + 1
+        else:
+            if len(counts) >= memory_budget:
+                spill_counts(counts, spill_dir)
+                counts = {}
+            counts[word] = 1
+    spill_counts(counts, spill_dir)
+
+    return {
+        'ranked': _rank_partitions(spill_dir, memory_budget),
+        'blank_count': blank_count,
+        'total_words': total_words
+    }
+
+
+def _rank_partitions(spill_dir, memory_budget):
+    """
+    Ordena cada partición derramada y mezcla las corridas resultantes.
+
+    Returns:
+        RankedFile con el ranking final
+    """
+    # Ordenar cada partición por separado dentro del presupuesto
+    run_paths = []
+    for index in range(SPILL_PARTITIONS):
+        path = os.path.join(spill_dir, f"part{index}.txt")
+        if os.path.exists(path):
+            run_paths.append(_rank_partition(path, memory_budget))
+
+    # Mezclar las corridas ordenadas en el ranking final
+    ranked_path = os.path.join(spill_dir, "ranked.txt")
+    runs = [read_ranked_run(path) for path in run_paths]
+    write_ranked_run(ranked_path, heapq.merge(*runs, key=_rank_key))
+    return RankedFile(ranked_path)
+
+
+def count_words_compact(words, on_blank=_report_blank):
+    """
+    Cuenta palabras guardándolas en un CompactVocabulary.
+
+    Args:
+        words: Iterable de palabras
+        on_blank: Función llamada con el número de cada línea vacía
+
+    Returns:
+        Diccionario con el formato de count_words, donde 'vocabulary'
+        reemplaza a los diccionarios de conteo
+    """
+    vocabulary = CompactVocabulary()
+    blank_count = 0
+    total_words = 0
+
+    for word in words:
+        total_words += 1
+        if word == '':
+            on_blank(total_words)
+            blank_count += 1
+        else:
+            vocabulary.add(word, total_words)
+
+    return {
+        'vocabulary': vocabulary,
+        'blank_count': blank_count,
+        'total_words': total_words
+    }
+
+
+def _sort_bucket(vocabulary, bucket):
+    """
+    Ordena los identificadores de una cubeta por los bytes de su palabra.
+
+    Las llaves (bytes) se crean por lotes de a lo más SORT_BATCH
+    palabras; los lotes ordenados se mezclan con heapq.merge, así que
+    nunca hay una llave por palabra de toda la cubeta en memoria.
+
+    Returns:
+        Iterable de identificadores en orden alfabético
+    """
+    if len(bucket) <= SORT_BATCH:
+        return sorted(bucket, key=vocabulary.word_bytes)
+    runs = []
+    for start in range(0, len(bucket), SORT_BATCH):
+        batch = bucket[start:start + SORT_BATCH]
+        runs.append(array('q', sorted(batch, key=vocabulary.word_bytes)))
+    return heapq.merge(*runs, key=vocabulary.word_bytes)
+
+
+def sort_vocabulary(vocabulary):
+    """
+    Ordena un CompactVocabulary igual que sort_word_counts.
+
+    Aplica el mismo ordenamiento por cubetas sobre la columna de conteos
+    y ordena cada cubeta por los bytes UTF-8 de las palabras, que siguen
+    el mismo orden que la comparación de strings.
+
+    Args:
+        vocabulary: CompactVocabulary con los conteos
+
+    Returns:
+        RankedVocabulary con los identificadores en orden de ranking
+    """
+    # Una cubeta por conteo presente
+    buckets = {}
+    for index, count in enumerate(vocabulary.counts):
+        bucket = buckets.get(count)
+        if bucket is None:
+            buckets[count] = array('q', [index])
+        else:
+            bucket.append(index)
+
+    order = array('q')
+    for count in sorted(buckets, reverse=True):
+        order.extend(_sort_bucket(vocabulary, buckets.pop(count)))
+    return RankedVocabulary(vocabulary, order)
+
+
+def count_words_sketch(words, capacity=SKETCH_CAPACITY,
+                       on_blank=_report_blank):
+    """
+    Cuenta palabras de forma aproximada en memoria fija.
+
+    Mantiene un Count-Min para las frecuencias, un Space-Saving para las
+    palabras más frecuentes y un HyperLogLog para las palabras distintas.
+    Grand Total y las líneas vacías se cuentan de forma exacta.
+
+    Args:
+        words: Iterable de palabras
+        capacity: Número de palabras frecuentes a conservar
+        on_blank: Función llamada con el número de cada línea vacía
+
+    Returns:
+        Diccionario con 'count_min', 'heavy_hitters', 'distinct',
+        'blank_count' y 'total_words'
+    """
+    count_min = CountMinSketch()
+    heavy_hitters = SpaceSaving(capacity)
+    distinct = HyperLogLog()
+    blank_count = 0
+    total_words = 0
+
+    for word in words:
+        total_words += 1
+        if word == '':
+            on_blank(total_words)
+            blank_count += 1
+        else:
+            hashed = hash64(word)
+            count_min.add(hashed)
+            distinct.add(hashed)
+            heavy_hitters.add(word)
+
+    return {
+        'count_min': count_min,
+        'heavy_hitters': heavy_hitters,
+        'distinct': distinct,
+        'blank_count': blank_count,
+        'total_words': total_words
+    }
+
+
+def rank_sketch(tally):
+    """
+    Ordena las palabras frecuentes de un conteo aproximado.
+
+    Ambos sketches sobreestiman, así que se usa el menor de los dos
+    conteos; el orden es el mismo que en sort_word_counts. Se ordenan
+    con sorted (a lo más capacity palabras) para que la memoria no
+    dependa del valor de los conteos estimados.
+
+    Returns:
+        Lista ordenada de tuplas (palabra, conteo estimado)
+    """
+    count_min = tally['count_min']
+    estimates = [
+        (word, min(count, count_min.estimate(hash64(word))))
+        for word, count in tally['heavy_hitters'].counts.items()
+    ]
+    return sorted(estimates, key=_rank_key)
+
+
+def sketch_summary(tally):
+    """
+    Filas con las estimaciones y cotas de error del modo aproximado.
+
+    La cota de error se redondea hacia arriba: redondearla al entero más
+    cercano podía reportar +0 aunque el conteo sí pueda sobreestimarse.
+    """
+    error, probability = tally['count_min'].error_bound()
+    distinct = tally['distinct']
+    return [
+        ("Distinct Words (approx)",
+         f"{distinct.estimate()} ± {distinct.relative_error():.1%}"),
+        ("Count Error Bound",
+         f"+{math.ceil(error)} (prob {probability:.1%})")
+    ]
+
+
 def get_filename_without_extension(filepath):
-    """Extrae el nombre del archivo sin extensión."""
-    basename = os.path.basename(filepath)
+    """Extrae el nombre del archivo sin extensión (ni la de compresión)."""
+    basename = os.path.basename(strip_compression_suffix(filepath))
     name, _ = os.path.splitext(basename)
     return name
 
@@ -130,19 +742,66 @@ def print_results(results):
     if results['blank_count'] > 0:
         print("(blank)\t")
     print(f"Grand Total\t{results['total_words']}")
+    for label, value in results.get('summary', []):
+        print(f"{label}\t{value}")
     print(f"\nTiempo transcurrido: {results['elapsed_time']:.3f} segundos")
 
 
 def _build_result_lines(results):
-    """Construye las líneas de resultado para escribir al archivo."""
-    lines = [f"Row Labels\tCount of {results['filename']}\n"]
+    """Genera las líneas de resultado para escribir al archivo."""
+    yield f"Row Labels\tCount of {results['filename']}\n"
     for word, count in results['sorted_counts']:
-        lines.append(f"{word}\t{count}\n")
+        yield f"{word}\t{count}\n"
     if results['blank_count'] > 0:
-        lines.append("(blank)\t\n")
-    lines.append(f"Grand Total\t{results['total_words']}\n")
+        yield "(blank)\t\n"
+    yield f"Grand Total\t{results['total_words']}\n"
+    for label, value in results.get('summary', []):
+        yield f"{label}\t{value}\n"
+    yield f"TIEMPO\t{results['elapsed_time']:.3f}s\n"
+
+
+def _corpus_rows(results):
+    """
+    Genera las filas (sin salto de línea) de la tabla del modo corpus.
+
+    Cada fila tiene una columna por archivo (vacía si la palabra no
+    aparece en él) y al final la columna Grand Total.
+    """
+    files = results['files']
+    yield "\t".join(["Row Labels"] + results['filenames'] + ["Grand Total"])
+    for word, count in results['sorted_counts']:
+        cells = [str(tally['counts'].get(word, '')) for tally in files]
+        yield "\t".join([word] + cells + [str(count)])
+    if results['blank_count'] > 0:
+        yield "\t".join(["(blank)"] + [""] * (len(files) + 1))
+    cells = [str(tally['total_words']) for tally in files]
+    yield "\t".join(["Grand Total"] + cells + [str(results['total_words'])])
+
+
+def print_corpus_results(results):
+    """
+    Imprime la tabla del modo corpus en consola.
+
+    Args:
+        results: Diccionario con files, filenames, sorted_counts,
+                 blank_count, total_words y elapsed_time
+    """
+    for row in _corpus_rows(results):
+        print(row)
+    print(f"\nTiempo transcurrido: {results['elapsed_time']:.3f} segundos")
+
+
+def write_corpus_results(results, output_path):
+    """
+    Agrega la tabla del modo corpus al archivo de salida.
+
+    Args:
+        results: Diccionario con los resultados del conteo combinado
+        output_path: Ruta del archivo de salida
+    """
+    lines = [row + "\n" for row in _corpus_rows(results)]
     lines.append(f"TIEMPO\t{results['elapsed_time']:.3f}s\n")
-    return lines
+    append_block(output_path, lines)
 
 
 def write_results(results, output_path):
@@ -156,61 +815,178 @@ def write_results(results, output_path):
         results: Diccionario con los resultados del conteo
         output_path: Ruta del archivo de salida
     """
-    result_lines = _build_result_lines(results)
+    append_block(output_path, _build_result_lines(results))
+
 
-    mode = 'a' if os.path.exists(output_path) else 'w'
-    with open(output_path, mode, encoding='utf-8') as file:
-        if mode == 'a':
-            file.write("\n\n")
-        file.writelines(result_lines)
+def _parse_positive_int(value):
+    """Convierte una opción numérica; termina con el uso si no es válida."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number <= 0:
+        print(USAGE)
+        sys.exit(1)
+    return number
 
 
 def _validate_args():
-    """Valida los argumentos de línea de comandos y retorna el filepath."""
-    if len(sys.argv) != 2:
-        print("Uso: python word_count.py archivoConDatos.txt")
+    """
+    Valida los argumentos de línea de comandos.
+
+    Returns:
+        Tupla (filepaths, options) donde options es un diccionario con
+        las opciones reconocidas ('top', 'workers', 'memory_budget',
+        'compact', 'sketch', 'tokenize', 'casefold', 'strip_punct')
+    """
+    options = {'top': None, 'workers': 1, 'memory_budget': None}
+    for name in FLAG_OPTIONS.values():
+        options[name] = False
+    positional = []
+    args = sys.argv[1:]
+    i = 0
+    while i < len(args):
+        if args[i] in INT_OPTIONS and i + 1 < len(args):
+            options[INT_OPTIONS[args[i]]] = _parse_positive_int(args[i + 1])
+            i += 2
+        elif args[i] in FLAG_OPTIONS:
+            options[FLAG_OPTIONS[args[i]]] = True
+            i += 1
+        elif args[i].startswith('--'):
+            print(USAGE)
+            sys.exit(1)
+        else:
+            positional.append(args[i])
+            i += 1
+
+    if not positional:
+        print(USAGE)
         sys.exit(1)
-    filepath = sys.argv[1]
-    if not os.path.exists(filepath):
-        print(f"Error: Archivo no encontrado: {filepath}")
+    if len(positional) > 1 and any(options[name] not in (None, False)
+                                   for name in SINGLE_FILE_OPTIONS):
+        print("Error: --memory-budget, --compact y --sketch aceptan "
+              "un solo archivo")
+        print(USAGE)
         sys.exit(1)
-    return filepath
+    for filepath in positional:
+        if not os.path.exists(filepath):
+            print(f"Error: Archivo no encontrado: {filepath}")
+            sys.exit(1)
+    return positional, options
 
 
-def main():
-    """Función principal del programa."""
-    filepath = _validate_args()
-    start_time = time.time()
+def _count_and_rank(filepath, options, spill_dir):
+    """
+    Cuenta y ordena las palabras según las opciones de ejecución.
 
-    # Leer palabras del archivo
-    words = read_words_from_file(filepath)
+    Returns:
+        Tupla (sorted_counts, tally) donde sorted_counts es un iterable
+        de tuplas (palabra, conteo) en orden de ranking
+    """
+    if options['sketch']:
+        capacity = max(SKETCH_CAPACITY, options['top'] or 0)
+        tally = count_words_sketch(_word_source(filepath, options), capacity)
+        tally['summary'] = sketch_summary(tally)
+        return rank_sketch(tally)[:options['top']], tally
+
+    if options['memory_budget'] is not None:
+        tally = count_words_external(_word_source(filepath, options),
+                                     options['memory_budget'], spill_dir)
+        ranked = tally['ranked']
+        if options['top'] is not None:
+            ranked = list(itertools.islice(ranked, options['top']))
+        return ranked, tally
+
+    if options['compact']:
+        tally = count_words_compact(_word_source(filepath, options))
+        if options['top'] is not None:
+            ranked = top_word_counts(tally['vocabulary'], options['top'])
+        else:
+            ranked = sort_vocabulary(tally['vocabulary'])
+        return ranked, tally
+
+    if options['workers'] > 1:
+        tally = count_words_parallel(filepath, options['workers'],
+                                     _tokenizer_of(options))
+    else:
+        tally = count_words(_word_source(filepath, options))
+
+    # Ordenar por frecuencia descendente (o solo las K primeras)
+    if options['top'] is not None:
+        return top_word_counts(tally['counts'], options['top']), tally
+    return sort_word_counts(tally['counts']), tally
+
+
+def _run_file(filepath, options):
+    """Cuenta un solo archivo, imprime y guarda sus resultados."""
+    with tempfile.TemporaryDirectory(prefix="word_count_") as spill_dir:
+        start_time = time.time()
 
-    # Contar palabras
-    word_counts, blank_count = count_words(words)
+        # Leer y contar palabras en un solo recorrido del archivo
+        sorted_counts, tally = _count_and_rank(filepath, options, spill_dir)
 
-    # Ordenar por frecuencia descendente
-    sorted_counts = sort_word_counts(word_counts)
+        # Calcular tiempo transcurrido
+        elapsed_time = time.time() - start_time
+
+        # Crear diccionario de resultados
+        results = {
+            'sorted_counts': sorted_counts,
+            'blank_count': tally['blank_count'],
+            'total_words': tally['total_words'],
+            'summary': tally.get('summary', []),
+            'filename': get_filename_without_extension(filepath),
+            'elapsed_time': elapsed_time
+        }
+
+        # Imprimir resultados en consola
+        print_results(results)
+
+        # Escribir resultados al archivo
+        write_results(results, OUTPUT_PATH)
+
+
+def _run_corpus(filepaths, options):
+    """Cuenta varios archivos y guarda una sola tabla combinada."""
+    start_time = time.time()
+
+    corpus = count_corpus(filepaths, options['workers'],
+                          _tokenizer_of(options))
+    if options['top'] is not None:
+        sorted_counts = top_word_counts(corpus['counts'], options['top'])
+    else:
+        sorted_counts = sort_word_counts(corpus['counts'])
 
-    # Calcular tiempo transcurrido
     elapsed_time = time.time() - start_time
 
-    # Crear diccionario de resultados
     results = {
+        'files': corpus['files'],
+        'filenames': [get_filename_without_extension(path)
+                      for path in filepaths],
         'sorted_counts': sorted_counts,
-        'blank_count': blank_count,
-        'total_words': len(words),
-        'filename': get_filename_without_extension(filepath),
+        'blank_count': corpus['blank_count'],
+        'total_words': corpus['total_words'],
         'elapsed_time': elapsed_time
     }
 
-    # Imprimir resultados en consola
-    print_results(results)
+    print_corpus_results(results)
+    write_corpus_results(results, OUTPUT_PATH)
+
 
-    # Escribir resultados al archivo
-    output_path = "WordCountResults.txt"
-    write_results(results, output_path)
+def main():
+    """Función principal del programa."""
+    filepaths, options = _validate_args()
+
+    try:
+        if len(filepaths) > 1:
+            _run_corpus(filepaths, options)
+        else:
+            _run_file(filepaths[0], options)
+    except OSError as io_error:
+        # Archivo ilegible o comprimido con datos corruptos
+        print(f"Error: No se pudo leer el archivo: {io_error}")
+        sys.exit(1)
 
-    print(f"Resultados guardados en: {output_path}")
+    print(f"Resultados guardados en: {OUTPUT_PATH}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,456 @@
+"""
+Pruebas de word_count.py.
+
+Actividad 4.2 - TC4017 Calidad de Software
+Tecnológico de Monterrey
+"""
+
+import contextlib
+import io
+import math
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(TESTS_DIR), "source"))
+
+# pylint: disable=wrong-import-position,import-error
+import word_count
+from sketches import CountMinSketch, HyperLogLog, SpaceSaving, hash64
+# pylint: enable=wrong-import-position,import-error
+
+TEST_CASES = ("TC1", "TC2", "TC3", "TC4", "TC5")
+SCRIPT = os.path.join(os.path.dirname(TESTS_DIR), "source", "word_count.py")
+
+
+def bubble_sort_reference(counts):
+    """
+    Ordenamiento burbuja original de sort_word_counts (referencia).
+
+    Args:
+        counts: Diccionario palabra -> conteo
+
+    Returns:
+        Lista ordenada de tuplas (palabra, conteo)
+    """
+    to_sort = list(counts.items())
+    length = len(to_sort)
+    for i in range(length):
+        for j in range(0, length - i - 1):
+            word1, count1 = to_sort[j]
+            word2, count2 = to_sort[j + 1]
+            if count1 < count2 or (count1 == count2 and word1 > word2):
+                to_sort[j], to_sort[j + 1] = to_sort[j + 1], to_sort[j]
+    return to_sort
+
+
+def count_file(test_case):
+    """Conteo de un archivo de P3/tests sin imprimir líneas vacías."""
+    path = os.path.join(TESTS_DIR, f"{test_case}.txt")
+    return word_count.count_words(word_count.read_words_from_file(path),
+                                  lambda line_num: None)
+
+
+class SortWordCountsTest(unittest.TestCase):
+    """sort_word_counts conserva el orden del ordenamiento burbuja."""
+
+    def test_test_cases(self):
+        """Mismo orden que el burbuja en P3/tests/TC1-TC5."""
+        for test_case in TEST_CASES:
+            with self.subTest(test_case=test_case):
+                counts = count_file(test_case)['counts']
+                self.assertEqual(word_count.sort_word_counts(counts),
+                                 bubble_sort_reference(counts))
+
+    def test_tie_heavy(self):
+        """Muchas palabras con el mismo conteo, incluidas no ASCII."""
+        generator = random.Random(42)
+        alphabet = "abcABCzñé漢 -"
+        counts = {}
+        for _ in range(600):
+            word = "".join(generator.choice(alphabet)
+                           for _ in range(generator.randint(1, 4)))
+            counts[word] = generator.choice((1, 1, 1, 2, 2, 3, 7))
+        self.assertEqual(word_count.sort_word_counts(counts),
+                         bubble_sort_reference(counts))
+
+    def test_single_count_and_empty(self):
+        """Casos límite: todo con conteo 1 y diccionario vacío."""
+        counts = {word: 1 for word in ("delta", "alpha", "charlie", "bravo")}
+        self.assertEqual(word_count.sort_word_counts(counts),
+                         bubble_sort_reference(counts))
+        self.assertEqual(word_count.sort_word_counts({}), [])
+
+    def test_huge_count(self):
+        """Un conteo enorme no reserva una cubeta por cada valor posible."""
+        counts = {'a': 10 ** 12, 'b': 1, 'c': 10 ** 12}
+        self.assertEqual(word_count.sort_word_counts(counts),
+                         [('a', 10 ** 12), ('c', 10 ** 12), ('b', 1)])
+
+
+class TokenizeWordsTest(unittest.TestCase):
+    """Modo de texto libre: --tokenize, --casefold y --strip-punct."""
+
+    def _tokens(self, lines, casefold=False, strip_punct=False):
+        """Lista de palabras de tokenize_words."""
+        return list(word_count.tokenize_words(lines, casefold, strip_punct))
+
+    def test_whitespace_tokens(self):
+        """Sin --strip-punct, una palabra es cualquier secuencia sin espacios."""
+        lines = ["Hola, mundo!  it's\tbien-hecho", "", "   ", "«sí» — ok"]
+        self.assertEqual(self._tokens(lines),
+                         ["Hola,", "mundo!", "it's", "bien-hecho",
+                          "«sí»", "—", "ok"])
+
+    def test_strip_punct(self):
+        """--strip-punct conserva contracciones y guiones internos."""
+        lines = ["Hola, mundo! it's rock’n’roll", "bien-hecho -- 'cita'",
+                 "año2024 ... _x_"]
+        self.assertEqual(self._tokens(lines, strip_punct=True),
+                         ["Hola", "mundo", "it's", "rock’n’roll",
+                          "bien-hecho", "cita", "año2024", "_x_"])
+
+    def test_casefold_non_ascii(self):
+        """--casefold unifica mayúsculas también fuera de ASCII."""
+        lines = ["Straße STRASSE", "ÉLAN élan", "ΣΊΣΥΦΟΣ σίσυφος"]
+        self.assertEqual(self._tokens(lines, casefold=True),
+                         ["strasse", "strasse", "élan", "élan",
+                          "σίσυφοσ", "σίσυφοσ"])
+
+    def test_options_switch_on_tokenizing(self):
+        """--casefold o --strip-punct solos activan el modo de texto libre."""
+        base = {'tokenize': False, 'casefold': False, 'strip_punct': False}
+        self.assertIsNone(word_count._tokenizer_of(  # pylint: disable=protected-access
+            base))
+        for name, expected in (('tokenize', (False, False)),
+                               ('casefold', (True, False)),
+                               ('strip_punct', (False, True))):
+            with self.subTest(option=name):
+                options = dict(base, **{name: True})
+                self.assertEqual(
+                    word_count._tokenizer_of(  # pylint: disable=protected-access
+                        options), expected)
+
+    def test_word_source_counts(self):
+        """Con --casefold se cuentan palabras y no se reportan vacías."""
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        path = os.path.join(tmp_dir, "text.txt")
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write("Hola hola\n\nHOLA mundo\n")
+        options = {'tokenize': False, 'casefold': True, 'strip_punct': False}
+        blanks = []
+        tally = word_count.count_words(
+            word_count._word_source(path, options),  # pylint: disable=protected-access
+            blanks.append)
+        self.assertEqual(tally['counts'], {'hola': 3, 'mundo': 1})
+        self.assertEqual((tally['blank_count'], tally['total_words']), (0, 4))
+        self.assertEqual(blanks, [])
+
+
+class TopWordCountsTest(unittest.TestCase):
+    """--top: las K primeras filas del ranking completo."""
+
+    def test_matches_sorted_prefix(self):
+        """top_word_counts(c, k) == sort_word_counts(c)[:k] con empates."""
+        generator = random.Random(11)
+        counts = {f"{generator.choice('abcñ')}{index}":
+                  generator.choice((1, 1, 2, 2, 3, 5))
+                  for index in range(300)}
+        ranked = word_count.sort_word_counts(counts)
+        for k in (1, 2, 7, 50, 299, 300, 1000):
+            with self.subTest(k=k):
+                self.assertEqual(word_count.top_word_counts(counts, k),
+                                 ranked[:k])
+
+    def _run(self, work_dir, *args):
+        """Ejecuta word_count.py y retorna las líneas de su salida."""
+        completed = subprocess.run(
+            [sys.executable, SCRIPT, *args], cwd=work_dir,
+            capture_output=True, text=True, check=True)
+        return completed.stdout.splitlines()
+
+    def test_output_keeps_totals(self):
+        """Con --top, (blank) y Grand Total no cambian."""
+        work_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, work_dir)
+        for name, text in (("a.txt", "x\ny\n\nx\nz\nx\ny\n"),
+                           ("b.txt", "z\n\nw\nz\n")):
+            with open(os.path.join(work_dir, name), 'w',
+                      encoding='utf-8') as file:
+                file.write(text)
+
+        for files in (["a.txt"], ["a.txt", "b.txt"]):
+            with self.subTest(files=files):
+                full_rows, full_totals = self._table(
+                    self._run(work_dir, *files))
+                top_rows, top_totals = self._table(
+                    self._run(work_dir, *files, "--top", "2"))
+                self.assertEqual(top_rows, full_rows[:3])
+                self.assertEqual(top_totals, full_totals)
+                self.assertEqual(len(top_totals), 2)
+
+    @staticmethod
+    def _table(lines):
+        """Separa la tabla en (encabezado y filas, filas de totales)."""
+        start = next(index for index, line in enumerate(lines)
+                     if line.startswith("Row Labels"))
+        end = next(index for index, line in enumerate(lines)
+                   if line.startswith(("(blank)", "Grand Total")))
+        return lines[start:end], lines[end:end + 2]
+
+
+class CountWordsExternalTest(unittest.TestCase):
+    """count_words_external respeta el presupuesto y el orden del ranking."""
+
+    def setUp(self):
+        self.spill_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.spill_dir)
+
+    def _rank_external(self, words, memory_budget):
+        """Ranking completo de count_words_external en un directorio nuevo."""
+        spill_dir = tempfile.mkdtemp(dir=self.spill_dir)
+        tally = word_count.count_words_external(
+            words, memory_budget, spill_dir, lambda line_num: None)
+        return list(tally['ranked']), tally
+
+    def test_matches_in_memory_ranking(self):
+        """Mismo ranking y totales que count_words con presupuestos chicos."""
+        for test_case in TEST_CASES:
+            expected = count_file(test_case)
+            path = os.path.join(TESTS_DIR, f"{test_case}.txt")
+            for memory_budget in (1, 3, 50):
+                with self.subTest(test_case=test_case,
+                                  memory_budget=memory_budget):
+                    ranked, tally = self._rank_external(
+                        word_count.read_words_from_file(path), memory_budget)
+                    self.assertEqual(
+                        ranked, word_count.sort_word_counts(expected['counts']))
+                    self.assertEqual(tally['blank_count'],
+                                     expected['blank_count'])
+                    self.assertEqual(tally['total_words'],
+                                     expected['total_words'])
+
+    def test_partitions_fit_budget(self):
+        """Ninguna partición combinada pasa del presupuesto."""
+        words = [f"w{index % 997}" for index in range(5000)]
+        sizes = []
+
+        def merge_and_record(path, memory_budget=None):
+            counts = merge_partition(path, memory_budget)
+            if counts is not None:
+                sizes.append(len(counts))
+            return counts
+
+        merge_partition = word_count.merge_partition
+        with mock.patch.object(word_count, 'merge_partition',
+                               side_effect=merge_and_record):
+            ranked, _ = self._rank_external(words, 5)
+        self.assertEqual(ranked, word_count.sort_word_counts(
+            word_count.count_words(words, lambda line_num: None)['counts']))
+        self.assertLessEqual(max(sizes), 5)
+
+
+class SortVocabularyTest(unittest.TestCase):
+    """sort_vocabulary da el mismo ranking que sort_word_counts."""
+
+    def _check(self, words):
+        """Compara ambos ordenamientos para la lista de palabras dada."""
+        tally = word_count.count_words_compact(words, lambda line_num: None)
+        counts = word_count.count_words(words, lambda line_num: None)
+        self.assertEqual(list(word_count.sort_vocabulary(tally['vocabulary'])),
+                         word_count.sort_word_counts(counts['counts']))
+
+    def test_test_cases(self):
+        """Mismo orden en P3/tests/TC1-TC5."""
+        for test_case in TEST_CASES:
+            with self.subTest(test_case=test_case):
+                path = os.path.join(TESTS_DIR, f"{test_case}.txt")
+                self._check(list(word_count.read_words_from_file(path)))
+
+    def test_batched_buckets(self):
+        """Cubetas más grandes que SORT_BATCH se ordenan por lotes."""
+        generator = random.Random(7)
+        words = ["".join(generator.choice("abñé漢z")
+                         for _ in range(generator.randint(1, 5)))
+                 for _ in range(3000)]
+        with mock.patch.object(word_count, 'SORT_BATCH', 16):
+            self._check(words)
+
+    def test_huge_count(self):
+        """Un conteo enorme no reserva una cubeta por cada valor posible."""
+        tally = word_count.count_words_compact(["b", "a", "c"],
+                                               lambda line_num: None)
+        vocabulary = tally['vocabulary']
+        vocabulary.counts[0] = 10 ** 12
+        vocabulary.counts[2] = 10 ** 12
+        self.assertEqual(list(word_count.sort_vocabulary(vocabulary)),
+                         [('b', 10 ** 12), ('c', 10 ** 12), ('a', 1)])
+
+
+class CountWordsParallelTest(unittest.TestCase):
+    """count_words_parallel coincide con la lectura secuencial."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+
+    def _check(self, data):
+        """Compara conteos y mensajes con 1 a 4 procesos."""
+        path = os.path.join(self.tmp_dir, "input.txt")
+        with open(path, 'wb') as file:
+            file.write(data)
+        expected_out = io.StringIO()
+        with contextlib.redirect_stdout(expected_out):
+            expected = word_count.count_words(
+                word_count.read_words_from_file(path))
+        for workers in (1, 2, 3, 4):
+            with self.subTest(workers=workers):
+                output = io.StringIO()
+                with contextlib.redirect_stdout(output):
+                    tally = word_count.count_words_parallel(path, workers)
+                self.assertEqual(tally, expected)
+                self.assertEqual(output.getvalue(), expected_out.getvalue())
+
+    def test_universal_newlines(self):
+        """Un \\r suelto termina una línea, igual que en modo texto."""
+        self._check(b"b\r\na\r\n\r\nb\r\nc\rd\n\n  \nZ\n")
+        self._check(b"x\ry\rz\r\rw")
+
+    def test_test_cases(self):
+        """Mismo conteo en P3/tests/TC1-TC5."""
+        for test_case in TEST_CASES:
+            path = os.path.join(TESTS_DIR, f"{test_case}.txt")
+            with open(path, 'rb') as file:
+                self._check(file.read())
+
+
+class ValidateArgsTest(unittest.TestCase):
+    """Validación de opciones de línea de comandos."""
+
+    def _validate(self, *args):
+        """Ejecuta _validate_args con los argumentos dados."""
+        argv = ["word_count.py"] + list(args)
+        with mock.patch.object(sys, 'argv', argv), \
+                contextlib.redirect_stdout(io.StringIO()):
+            return word_count._validate_args()  # pylint: disable=protected-access
+
+    def test_single_file_options_reject_corpus(self):
+        """--memory-budget, --compact y --sketch rechazan varios archivos."""
+        paths = [os.path.join(TESTS_DIR, f"{test_case}.txt")
+                 for test_case in ("TC1", "TC2")]
+        for option in (["--compact"], ["--sketch"], ["--memory-budget", "5"]):
+            with self.subTest(option=option):
+                with self.assertRaises(SystemExit) as context:
+                    self._validate(*paths, *option)
+                self.assertEqual(context.exception.code, 1)
+                _, options = self._validate(paths[0], *option)
+                self.assertTrue(any(options[name] for name in
+                                    word_count.SINGLE_FILE_OPTIONS))
+
+    def test_corpus_options(self):
+        """Las opciones del modo corpus se aceptan con varios archivos."""
+        paths = [os.path.join(TESTS_DIR, f"{test_case}.txt")
+                 for test_case in ("TC1", "TC2")]
+        filepaths, options = self._validate(*paths, "--top", "3",
+                                            "--workers", "2", "--casefold")
+        self.assertEqual(filepaths, paths)
+        self.assertEqual((options['top'], options['workers']), (3, 2))
+        self.assertTrue(options['casefold'])
+
+
+class SketchSummaryTest(unittest.TestCase):
+    """Resumen de las cotas del modo aproximado."""
+
+    def test_error_bound_rounds_up(self):
+        """Una cota fraccionaria nunca se reporta como +0."""
+        path = os.path.join(TESTS_DIR, "TC3.txt")
+        tally = word_count.count_words_sketch(
+            word_count.read_words_from_file(path), on_blank=lambda n: None)
+        error, _ = tally['count_min'].error_bound()
+        self.assertGreater(error, 0)
+        summary = dict(word_count.sketch_summary(tally))
+        bound = summary["Count Error Bound"].split()[0]
+        self.assertEqual(bound, f"+{math.ceil(error)}")
+        self.assertNotEqual(bound, "+0")
+
+    def test_rank_sketch_huge_counts(self):
+        """El ranking aproximado no depende del valor de los conteos."""
+        tally = word_count.count_words_sketch([], on_blank=lambda n: None)
+        for word, count in (("b", 10 ** 12), ("a", 10 ** 12), ("c", 7)):
+            tally['count_min'].add(hash64(word), count)
+            tally['heavy_hitters'].add(word, count)
+        self.assertEqual(word_count.rank_sketch(tally),
+                         [("a", 10 ** 12), ("b", 10 ** 12), ("c", 7)])
+
+
+class SketchMergeTest(unittest.TestCase):
+    """Combinar sketches por archivo equivale a un sketch de todo."""
+
+    def setUp(self):
+        generator = random.Random(3)
+        vocabulary = [f"w{index}" for index in range(400)]
+        # Distribución sesgada: pocas palabras muy frecuentes
+        self.left = [vocabulary[int(generator.paretovariate(1.2)) % 400]
+                     for _ in range(3000)]
+        self.right = [vocabulary[int(generator.paretovariate(1.2)) % 400]
+                      for _ in range(2000)]
+
+    @staticmethod
+    def _fill(sketch, words, hashed=True):
+        """Agrega las palabras (o sus hashes) al sketch y lo retorna."""
+        for word in words:
+            sketch.add(hash64(word) if hashed else word)
+        return sketch
+
+    def test_count_min(self):
+        """Count-Min combinado tiene las mismas filas y estimaciones."""
+        merged = self._fill(CountMinSketch(), self.left)
+        merged.merge(self._fill(CountMinSketch(), self.right))
+        single = self._fill(CountMinSketch(), self.left + self.right)
+        self.assertEqual(merged.rows, single.rows)
+        self.assertEqual(merged.total, single.total)
+        for word in set(self.left + self.right):
+            self.assertEqual(merged.estimate(hash64(word)),
+                             single.estimate(hash64(word)))
+
+    def test_hyperloglog(self):
+        """HyperLogLog combinado tiene los mismos registros."""
+        merged = self._fill(HyperLogLog(), self.left)
+        merged.merge(self._fill(HyperLogLog(), self.right))
+        single = self._fill(HyperLogLog(), self.left + self.right)
+        self.assertEqual(merged.registers, single.registers)
+        self.assertEqual(merged.estimate(), single.estimate())
+
+    def test_space_saving_exact(self):
+        """Sin desalojos, Space-Saving combinado da los conteos exactos."""
+        merged = self._fill(SpaceSaving(500), self.left, hashed=False)
+        merged.merge(self._fill(SpaceSaving(500), self.right, hashed=False))
+        single = self._fill(SpaceSaving(500), self.left + self.right,
+                            hashed=False)
+        self.assertEqual(merged.counts, single.counts)
+        self.assertEqual(set(merged.errors.values()), {0})
+
+    def test_space_saving_bounds(self):
+        """Con desalojos, conteo y conteo - error acotan el conteo real."""
+        capacity = 40
+        merged = self._fill(SpaceSaving(capacity), self.left, hashed=False)
+        merged.merge(self._fill(SpaceSaving(capacity), self.right,
+                                hashed=False))
+        exact = word_count.count_words(self.left + self.right,
+                                       lambda line_num: None)
+        self.assertEqual(len(merged.counts), capacity)
+        for word, count in merged.counts.items():
+            true_count = exact['counts'][word]
+            self.assertLessEqual(count - merged.errors[word], true_count)
+            self.assertGreaterEqual(count, true_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
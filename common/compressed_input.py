@@ -0,0 +1,151 @@
+"""
+Lectura transparente de archivos comprimidos (gzip, bz2, xz).
+
+Actividad 4.2 - TC4017 Calidad de Software
+Tecnológico de Monterrey
+
+El formato se detecta por los bytes mágicos. La descompresión corre en
+un hilo en segundo plano que llena una cola acotada de bloques grandes,
+así que se traslapa con el análisis de las líneas. Los números de línea
+corresponden al contenido descomprimido.
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import queue
+import threading
+
+BLOCK_SIZE = 1 << 20
+QUEUE_BLOCKS = 8
+
+COMPRESSED_SUFFIXES = (".gz", ".bz2", ".xz")
+
+# Bytes mágicos -> función que abre el archivo comprimido en modo binario
+DECOMPRESSORS = (
+    (b"\x1f\x8b", gzip.open),
+    (b"BZh", bz2.open),
+    (b"\xfd7zXZ\x00", lzma.open),
+)
+
+
+def detect_compression(filepath):
+    """
+    Detecta si un archivo está comprimido.
+
+    Args:
+        filepath: Ruta al archivo
+
+    Returns:
+        Función para abrirlo en modo binario, o None si no está comprimido
+    """
+    with open(filepath, 'rb') as file:
+        header = file.read(6)
+    for magic, opener in DECOMPRESSORS:
+        if header.startswith(magic):
+            return opener
+    return None
+
+
+def strip_compression_suffix(filepath):
+    """Quita la extensión de compresión (.gz, .bz2, .xz) si la tiene."""
+    for suffix in COMPRESSED_SUFFIXES:
+        if filepath.endswith(suffix):
+            return filepath[:-len(suffix)]
+    return filepath
+
+
+class _QueueReader(io.RawIOBase):
+    """Flujo binario que consume los bloques producidos por el hilo."""
+
+    def __init__(self, blocks, stop):
+        super().__init__()
+        self.blocks = blocks
+        self.stop = stop
+        self.pending = b""
+        self.finished = False
+        self.error = None
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self.error is not None:
+            raise self.error
+        while not self.pending and not self.finished:
+            block = self.blocks.get()
+            if isinstance(block, BaseException):
+                self.finished = True
+                self.error = block
+                raise block
+            if block is None:
+                self.finished = True
+            else:
+                self.pending = block
+        size = min(len(buffer), len(self.pending))
+        buffer[:size] = self.pending[:size]
+        self.pending = self.pending[size:]
+        return size
+
+    def close(self):
+        self.stop.set()
+        super().close()
+
+
+def _decompress_blocks(filepath, opener, blocks, stop):
+    """Hilo productor: descomprime el archivo en bloques hacia la cola."""
+    try:
+        with opener(filepath, 'rb') as source:
+            while not stop.is_set():
+                block = source.read(BLOCK_SIZE)
+                if not block:
+                    break
+                _put(blocks, block, stop)
+        _put(blocks, None, stop)
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        # Cualquier falla (p. ej. zlib.error) se reenvía al lector para
+        # que no se quede esperando un bloque que nunca llegará. Los
+        # errores propios del descompresor (zlib.error, EOFError,
+        # lzma.LZMAError) se envuelven en OSError, el mismo tipo que un
+        # error de lectura, para que los programas los reporten igual.
+        if not isinstance(error, OSError):
+            wrapped = OSError(f"Contenido comprimido inválido: {error!r}")
+            wrapped.__cause__ = error
+            error = wrapped
+        _put(blocks, error, stop)
+
+
+def _put(blocks, item, stop):
+    """Agrega a la cola sin bloquearse para siempre si el lector cerró."""
+    while not stop.is_set():
+        try:
+            blocks.put(item, timeout=0.1)
+            return
+        except queue.Full:
+            continue
+
+
+def open_text(filepath, encoding='utf-8'):
+    """
+    Abre un archivo de texto, comprimido o no, para leerlo por líneas.
+
+    Args:
+        filepath: Ruta al archivo
+        encoding: Codificación del contenido (descomprimido)
+
+    Returns:
+        Flujo de texto (usable con 'with' e iterable por líneas)
+    """
+    opener = detect_compression(filepath)
+    if opener is None:
+        return open(filepath, 'r', encoding=encoding)
+
+    blocks = queue.Queue(QUEUE_BLOCKS)
+    stop = threading.Event()
+    threading.Thread(target=_decompress_blocks,
+                     args=(filepath, opener, blocks, stop),
+                     daemon=True).start()
+    raw = _QueueReader(blocks, stop)
+    return io.TextIOWrapper(io.BufferedReader(raw, BLOCK_SIZE),
+                            encoding=encoding)
@@ -0,0 +1,121 @@
+"""
+Escritura segura de archivos de resultados entre procesos concurrentes.
+
+Actividad 4.2 - TC4017 Calidad de Software
+Tecnológico de Monterrey
+
+Varias ejecuciones en paralelo comparten StatisticsResults.txt,
+ConvertionResults.txt y WordCountResults.txt. Cada actualización toma un
+candado consultivo (flock) sobre un archivo ".lock" hermano; la tabla de
+P1 se reescribe de forma atómica (archivo temporal + rename) y los
+bloques de P2/P3 se agregan con una sola escritura.
+"""
+
+import contextlib
+import os
+import tempfile
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+BLOCK_SEPARATOR = "\n\n"
+
+# Tamaño máximo de cada escritura al agregar un bloque
+WRITE_CHUNK = 1 << 20
+
+
+@contextlib.contextmanager
+def results_lock(path):
+    """
+    Candado exclusivo para leer-modificar-escribir un archivo de resultados.
+
+    Usa un archivo "<path>.lock" para que el candado sobreviva al rename
+    de write_atomic. Sin fcntl (Windows) no bloquea.
+
+    Args:
+        path: Ruta del archivo de resultados
+    """
+    with open(path + ".lock", 'a', encoding='utf-8') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _target_mode(path):
+    """Permisos para el archivo nuevo: los del anterior o 0o666 - umask."""
+    try:
+        return os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def write_atomic(path, text):
+    """
+    Reemplaza el contenido de un archivo de forma atómica.
+
+    Escribe en un temporal del mismo directorio y lo renombra, así que
+    los lectores ven el archivo anterior o el nuevo, nunca uno parcial.
+    El archivo conserva sus permisos (mkstemp crea el temporal con 0600).
+
+    Args:
+        path: Ruta del archivo
+        text: Contenido completo
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    handle, temp_path = tempfile.mkstemp(dir=directory, prefix=".tmp_")
+    try:
+        with os.fdopen(handle, 'w', encoding='utf-8') as file:
+            file.write(text)
+        os.chmod(temp_path, _target_mode(path))
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def _write_all(handle, data):
+    """Escribe todos los bytes de data en el descriptor handle."""
+    written = 0
+    while written < len(data):
+        written += os.write(handle, data[written:])
+
+
+def append_block(path, lines):
+    """
+    Agrega un bloque de resultados al final del archivo.
+
+    Si el archivo ya tiene contenido, antepone dos saltos de línea. El
+    bloque se escribe en modo O_APPEND, en trozos de a lo más WRITE_CHUNK
+    bytes, mientras se tiene el candado: no se intercala con otras
+    ejecuciones y no se copia completo en memoria.
+
+    Args:
+        path: Ruta del archivo de resultados
+        lines: Iterable de líneas (con salto de línea) del bloque
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+    with results_lock(path):
+        handle = os.open(path, flags, 0o666)
+        try:
+            pending = []
+            size = 0
+            if os.fstat(handle).st_size > 0:
+                pending.append(BLOCK_SEPARATOR)
+            for line in lines:
+                pending.append(line)
+                size += len(line)
+                if size >= WRITE_CHUNK:
+                    _write_all(handle, "".join(pending).encode('utf-8'))
+                    pending = []
+                    size = 0
+            _write_all(handle, "".join(pending).encode('utf-8'))
+        finally:
+            os.close(handle)
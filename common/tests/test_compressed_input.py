@@ -0,0 +1,137 @@
+"""
+Pruebas de common/compressed_input.py.
+
+Actividad 4.2 - TC4017 Calidad de Software
+Tecnológico de Monterrey
+"""
+
+import bz2
+import gzip
+import itertools
+import lzma
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+
+COMMON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROOT_DIR = os.path.dirname(COMMON_DIR)
+sys.path.insert(0, COMMON_DIR)
+
+# pylint: disable=wrong-import-position,import-error
+from compressed_input import open_text, strip_compression_suffix
+# pylint: enable=wrong-import-position,import-error
+
+TEXT = "".join(f"linea {i}\n" for i in range(20000))
+
+COMPRESSORS = {
+    '.gz': gzip.compress,
+    '.bz2': bz2.compress,
+    '.xz': lzma.compress,
+}
+
+
+def _read_all(path, timeout=10):
+    """Lee el archivo en un hilo; retorna (texto, error, terminó_a_tiempo)."""
+    result = {'text': None, 'error': None}
+
+    def target():
+        try:
+            with open_text(path) as file:
+                result['text'] = file.read()
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            result['error'] = error
+
+    reader = threading.Thread(target=target, daemon=True)
+    reader.start()
+    reader.join(timeout)
+    return result['text'], result['error'], not reader.is_alive()
+
+
+class CompressedInputTest(unittest.TestCase):
+    """Lectura de archivos gzip, bz2 y xz válidos y corruptos."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def _write(self, name, data):
+        """Crea un archivo de prueba con los bytes indicados."""
+        path = os.path.join(self.directory, name)
+        with open(path, 'wb') as file:
+            file.write(data)
+        return path
+
+    def test_valid_files_match_plain_text(self):
+        """Los tres formatos se leen igual que el texto original."""
+        for suffix, compress in COMPRESSORS.items():
+            with self.subTest(suffix=suffix):
+                path = self._write("ok" + suffix, compress(TEXT.encode()))
+                text, error, finished = _read_all(path)
+                self.assertTrue(finished)
+                self.assertIsNone(error)
+                self.assertEqual(text, TEXT)
+
+    def test_plain_file(self):
+        """Un archivo sin comprimir se lee directamente."""
+        path = self._write("plain.txt", TEXT.encode())
+        with open_text(path) as file:
+            self.assertEqual(file.read(), TEXT)
+
+    def test_corrupt_files_raise_instead_of_hanging(self):
+        """Datos corruptos producen un error en lugar de bloquear al lector."""
+        for suffix, compress in COMPRESSORS.items():
+            with self.subTest(suffix=suffix):
+                data = bytearray(compress(TEXT.encode()))
+                # Justo después del encabezado: en gzip produce zlib.error
+                for offset in range(10, 18):
+                    data[offset] ^= 0xFF
+                path = self._write("bad" + suffix, bytes(data))
+                _, error, finished = _read_all(path)
+                self.assertTrue(finished, "la lectura se quedó bloqueada")
+                self.assertIsInstance(error, OSError)
+
+    def test_truncated_file_raises(self):
+        """Un archivo truncado produce un error."""
+        data = gzip.compress(TEXT.encode())
+        path = self._write("short.gz", data[:len(data) // 3])
+        _, error, finished = _read_all(path)
+        self.assertTrue(finished)
+        self.assertIsInstance(error, OSError)
+
+    def test_programs_report_corrupt_input(self):
+        """Los programas reportan un .gz corrupto sin traza y con código 1."""
+        data = bytearray(gzip.compress(TEXT.encode()))
+        path = self._write("short.txt.gz", bytes(data[:len(data) // 3]))
+        for offset in range(10, 18):
+            data[offset] ^= 0xFF
+        bad_path = self._write("bad.txt.gz", bytes(data))
+        scripts = [os.path.join(ROOT_DIR, "P1", "source",
+                                "compute_statistics.py"),
+                   os.path.join(ROOT_DIR, "P2", "source",
+                                "convert_numbers.py"),
+                   os.path.join(ROOT_DIR, "P3", "source", "word_count.py")]
+        for script, input_path in itertools.product(scripts,
+                                                    (path, bad_path)):
+            with self.subTest(script=os.path.basename(script),
+                              path=os.path.basename(input_path)):
+                completed = subprocess.run(
+                    [sys.executable, script, input_path],
+                    cwd=self.directory, capture_output=True, text=True,
+                    check=False, timeout=60)
+                self.assertEqual(completed.returncode, 1)
+                self.assertIn("Error: No se pudo leer el archivo",
+                              completed.stdout)
+                self.assertNotIn("Traceback", completed.stderr)
+
+    def test_strip_compression_suffix(self):
+        """Se quita solo la extensión de compresión."""
+        self.assertEqual(strip_compression_suffix("TC1.txt.gz"), "TC1.txt")
+        self.assertEqual(strip_compression_suffix("TC1.txt"), "TC1.txt")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+"""
+Pruebas de common/results_io.py, incluida una prueba de estrés con
+varios procesos escribiendo el mismo archivo de resultados.
+
+Actividad 4.2 - TC4017 Calidad de Software
+Tecnológico de Monterrey
+"""
+
+import multiprocessing
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import unittest
+
+COMMON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+P1_SOURCE = os.path.join(os.path.dirname(COMMON_DIR), "P1", "source")
+sys.path.insert(0, COMMON_DIR)
+
+# pylint: disable=wrong-import-position,import-error
+import results_io
+from results_io import append_block, write_atomic
+# pylint: enable=wrong-import-position,import-error
+
+PROCESSES = 8
+BLOCKS_PER_PROCESS = 20
+LINES_PER_BLOCK = 200
+
+
+def _append_blocks(path, writer, line_length):
+    """Proceso de prueba: agrega bloques identificables al archivo."""
+    for block in range(BLOCKS_PER_PROCESS):
+        tag = f"{writer}-{block}"
+        lines = (f"{tag}\t{line}\t{'x' * line_length}\n"
+                 for line in range(LINES_PER_BLOCK))
+        append_block(path, lines)
+
+
+def _write_statistics(directory, column):
+    """Proceso de prueba: agrega una columna con write_results de P1."""
+    sys.path.insert(0, P1_SOURCE)
+    # pylint: disable-next=import-outside-toplevel,import-error
+    import compute_statistics
+    os.chdir(directory)
+    stats = {"count": column, "mean": column, "median": column,
+             "mode": column, "sd": column, "variance": column}
+    compute_statistics.write_results(stats, 0.5, f"F{column}.txt")
+
+
+def _run_processes(target, args_list):
+    """Ejecuta target en un proceso por juego de argumentos y espera."""
+    processes = [multiprocessing.Process(target=target, args=args)
+                 for args in args_list]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+        if process.exitcode != 0:
+            raise AssertionError(f"proceso terminó con {process.exitcode}")
+
+
+class ResultsIoTest(unittest.TestCase):
+    """Escrituras concurrentes, atómicas y por trozos."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "Results.txt")
+
+    def _assert_blocks_intact(self, expected_blocks):
+        """Cada bloque está completo y sin líneas de otro bloque."""
+        with open(self.path, encoding='utf-8') as file:
+            blocks = file.read().split("\n\n\n")
+        self.assertEqual(len(blocks), expected_blocks)
+        tags = set()
+        for block in blocks:
+            rows = [line.split("\t") for line in block.splitlines()]
+            self.assertEqual(len(rows), LINES_PER_BLOCK)
+            self.assertEqual({row[0] for row in rows}, {rows[0][0]})
+            self.assertEqual([int(row[1]) for row in rows],
+                             list(range(LINES_PER_BLOCK)))
+            tags.add(rows[0][0])
+        self.assertEqual(len(tags), expected_blocks)
+
+    def test_concurrent_append_block(self):
+        """Varios procesos agregan bloques sin intercalarse."""
+        _run_processes(_append_blocks,
+                       [(self.path, writer, 10) for writer in range(PROCESSES)])
+        self._assert_blocks_intact(PROCESSES * BLOCKS_PER_PROCESS)
+
+    def test_concurrent_append_large_blocks(self):
+        """Bloques mayores que WRITE_CHUNK tampoco se intercalan."""
+        line_length = 2 * results_io.WRITE_CHUNK // LINES_PER_BLOCK
+        _run_processes(_append_blocks,
+                       [(self.path, writer, line_length)
+                        for writer in range(4)])
+        self._assert_blocks_intact(4 * BLOCKS_PER_PROCESS)
+
+    @unittest.skipIf(sys.version_info < (3, 12),
+                     "compute_statistics.py requiere Python 3.12")
+    def test_concurrent_statistics_columns(self):
+        """Ninguna columna de StatisticsResults.txt se pierde."""
+        _run_processes(_write_statistics,
+                       [(self.directory, column)
+                        for column in range(1, PROCESSES * 2 + 1)])
+        path = os.path.join(self.directory, "StatisticsResults.txt")
+        with open(path, encoding='utf-8') as file:
+            rows = [line.rstrip("\n").split("\t") for line in file]
+        header = rows[0][1:]
+        self.assertEqual(sorted(header),
+                         sorted(f"F{i}" for i in range(1, PROCESSES * 2 + 1)))
+        for row in rows[1:7]:
+            for name, value in zip(header, row[1:]):
+                self.assertEqual(value, name[1:])
+
+    def test_write_atomic_keeps_mode(self):
+        """El reemplazo atómico conserva los permisos del archivo."""
+        with open(self.path, 'w', encoding='utf-8') as file:
+            file.write("antes\n")
+        os.chmod(self.path, 0o644)
+        write_atomic(self.path, "después\n")
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o644)
+        with open(self.path, encoding='utf-8') as file:
+            self.assertEqual(file.read(), "después\n")
+
+    def test_write_atomic_new_file_uses_umask(self):
+        """Un archivo nuevo recibe 0o666 menos la umask, no 0o600."""
+        umask = os.umask(0o022)
+        try:
+            write_atomic(self.path, "nuevo\n")
+        finally:
+            os.umask(umask)
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o644)
+
+    def test_separator_only_between_blocks(self):
+        """El primer bloque no lleva separador; los siguientes sí."""
+        append_block(self.path, ["a\n"])
+        append_block(self.path, iter(["b\n", "c\n"]))
+        with open(self.path, encoding='utf-8') as file:
+            self.assertEqual(file.read(), "a\n\n\nb\nc\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
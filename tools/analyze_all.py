@@ -0,0 +1,177 @@
+"""
+Ejecuta compute_statistics, convert_numbers y word_count sobre un mismo
+archivo leyéndolo una sola vez.
+
+Actividad 4.2 - TC4017 Calidad de Software
+Tecnológico de Monterrey
+
+Cada línea se clasifica una vez con extract_number (P1) y alimenta al
+mismo tiempo los datos de estadísticas, las conversiones de P2 y la
+tabla de frecuencias de P3. Al final se imprime la salida normal de cada
+programa, en ese orden, y se actualiza su archivo de resultados.
+
+Uso: python analyze_all.py archivoConDatos.txt
+"""
+
+import os
+import sys
+import time
+
+from tool_runner import load_tools
+
+USAGE = "Uso: python analyze_all.py archivoConDatos.txt"
+
+
+def scan_lines(file, scan):
+    """
+    Recorre el archivo una vez alimentando los datos de P1 y P2.
+
+    Es un generador: entrega cada línea sin espacios para que count_words
+    (P3) la cuente en el mismo recorrido.
+
+    Args:
+        file: Archivo de texto abierto
+        scan: Diccionario con las listas a llenar ('numbers', 'p1_errors',
+              'items') y el contador 'total_count'
+
+    Yields:
+        Cada línea sin espacios al inicio/fin (vacía si la línea lo está)
+    """
+    extract_number = scan['tools']['compute_statistics'].extract_number
+    for line_num, line in enumerate(file, 1):
+        text = line.strip()
+        if text:
+            scan['total_count'] += 1
+            number, success = extract_number(text)
+            if success:
+                scan['numbers'].append(number)
+            else:
+                scan['p1_errors'].append(
+                    f'Error: Dato invalido en la linea {line_num}: "{text}"')
+            scan['items'].append((text, _as_integer(text, number, success)))
+        yield text
+
+
+def _as_integer(text, number, success):
+    """
+    Valor entero para P2 (int(text)), o None si P2 lo considera inválido.
+
+    Todo lo que int() acepta también lo acepta extract_number, así que
+    solo se reintenta cuando P1 obtuvo un entero.
+    """
+    if not success or not isinstance(number, int):
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        return None
+
+
+def report_statistics(module, scan, filepath, start_time):
+    """Imprime y guarda los resultados de compute_statistics."""
+    for message in scan['p1_errors']:
+        print(message)
+    numbers = scan['numbers']
+    if len(numbers) == 0:
+        print("Error: No se encontraron numeros validos en el archivo")
+        return
+
+    mean = module.calculate_mean(numbers)
+    stats = {
+        "count": scan['total_count'],
+        "mean": mean,
+        "median": module.calculate_median(numbers),
+        "mode": module.calculate_mode(numbers),
+        "sd": module.calculate_population_std_dev(numbers, mean),
+        "variance": module.calculate_population_variance(numbers, mean),
+    }
+    elapsed_time = time.time() - start_time
+    module.print_results(stats, elapsed_time)
+    module.write_results(stats, elapsed_time, filepath)
+
+
+def report_conversions(module, scan, filepath, start_time):
+    """Imprime y guarda los resultados de convert_numbers."""
+    items = scan['items']
+    converted = iter(module.convert_numbers_vectorized(
+        [number for _, number in items if number is not None]))
+
+    results = []
+    for i, (original, number) in enumerate(items, 1):
+        if number is not None:
+            binary, hexval = next(converted)
+            results.append((original, binary, hexval))
+        else:
+            print(f"Error: Dato inválido '{original}' en la línea {i}")
+            results.append((original, "#VALUE!", "#VALUE!"))
+
+    elapsed_time = time.time() - start_time
+    filename = module.get_filename_without_extension(filepath)
+    module.print_results(results, filename, elapsed_time)
+    output_path = "ConvertionResults.txt"
+    module.write_results(results, filename, elapsed_time, output_path)
+    print(f"\nResultados guardados en: {output_path}")
+    print(f"Tiempo transcurrido: {elapsed_time:.3f} segundos")
+
+
+def report_word_counts(module, tally, filepath, start_time):
+    """Imprime y guarda los resultados de word_count."""
+    for line_num in tally['blank_lines']:
+        print(f"Error: Línea vacía en la línea {line_num}")
+    results = {
+        'sorted_counts': module.sort_word_counts(tally['counts']),
+        'blank_count': tally['blank_count'],
+        'total_words': tally['total_words'],
+        'filename': module.get_filename_without_extension(filepath),
+        'elapsed_time': time.time() - start_time
+    }
+    module.print_results(results)
+    output_path = "WordCountResults.txt"
+    module.write_results(results, output_path)
+    print(f"Resultados guardados en: {output_path}")
+
+
+def analyze_file(filepath):
+    """
+    Analiza un archivo con los tres programas en un solo recorrido.
+
+    Args:
+        filepath: Ruta al archivo de entrada
+    """
+    tools = load_tools()
+    word_count = tools['word_count']
+    start_time = time.time()
+
+    scan = {'tools': tools, 'numbers': [], 'p1_errors': [], 'items': [],
+            'total_count': 0}
+    blank_lines = []
+    with word_count.open_text(filepath) as file:
+        tally = word_count.count_words(scan_lines(file, scan),
+                                       blank_lines.append)
+    tally['blank_lines'] = blank_lines
+
+    report_statistics(tools['compute_statistics'], scan, filepath,
+                      start_time)
+    report_conversions(tools['convert_numbers'], scan, filepath, start_time)
+    report_word_counts(word_count, tally, filepath, start_time)
+
+
+def main():
+    """Función principal del programa."""
+    if len(sys.argv) != 2:
+        print(USAGE)
+        sys.exit(1)
+    filepath = sys.argv[1]
+    if not os.path.exists(filepath):
+        print(f"Error: Archivo no encontrado: {filepath}")
+        sys.exit(1)
+    try:
+        analyze_file(filepath)
+    except OSError as io_error:
+        # Archivo ilegible o comprimido con datos corruptos
+        print(f"Error: No se pudo leer el archivo: {io_error}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
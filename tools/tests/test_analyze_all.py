@@ -0,0 +1,98 @@
+"""
+Pruebas de analyze_all.py.
+
+Actividad 4.2 - TC4017 Calidad de Software
+Tecnológico de Monterrey
+"""
+
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+TOOLS_DIR = os.path.dirname(TESTS_DIR)
+ROOT_DIR = os.path.dirname(TOOLS_DIR)
+
+# Scripts en el orden en que analyze_all imprime sus resultados
+SCRIPTS = ("P1/source/compute_statistics.py",
+           "P2/source/convert_numbers.py",
+           "P3/source/word_count.py")
+
+RESULTS_FILES = ("StatisticsResults.txt", "ConvertionResults.txt",
+                 "WordCountResults.txt")
+
+# Tiempos transcurridos, que cambian entre ejecuciones
+ELAPSED_PATTERN = re.compile(r"\d+\.\d+( segundos|s\b)")
+
+
+def normalize(text):
+    """Reemplaza los tiempos transcurridos por una marca fija."""
+    return ELAPSED_PATTERN.sub("<tiempo>", text)
+
+
+class AnalyzeAllTest(unittest.TestCase):
+    """analyze_all equivale a ejecutar los tres scripts por separado."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+
+    def _work_dir(self, name, source):
+        """Directorio nuevo con una copia del archivo de entrada."""
+        work_dir = tempfile.mkdtemp(prefix=name, dir=self.tmp_dir)
+        shutil.copy(source, os.path.join(work_dir, "input.txt"))
+        return work_dir
+
+    @staticmethod
+    def _run(script, work_dir):
+        """Ejecuta un script sobre input.txt y retorna su salida."""
+        completed = subprocess.run(
+            [sys.executable, script, "input.txt"], cwd=work_dir,
+            capture_output=True, text=True, check=True)
+        return completed.stdout
+
+    @staticmethod
+    def _results(work_dir):
+        """Contenido normalizado de los tres archivos de resultados."""
+        contents = []
+        for name in RESULTS_FILES:
+            with open(os.path.join(work_dir, name), 'r',
+                      encoding='utf-8') as file:
+                contents.append(normalize(file.read()))
+        return contents
+
+    def _check(self, source):
+        """Compara salida y archivos de resultados para un archivo."""
+        separate_dir = self._work_dir("separate", source)
+        separate_output = "".join(
+            self._run(os.path.join(ROOT_DIR, script), separate_dir)
+            for script in SCRIPTS)
+        combined_dir = self._work_dir("combined", source)
+        combined_output = self._run(os.path.join(TOOLS_DIR, "analyze_all.py"),
+                                    combined_dir)
+        self.assertEqual(normalize(combined_output),
+                         normalize(separate_output))
+        self.assertEqual(self._results(combined_dir),
+                         self._results(separate_dir))
+
+    def test_test_cases(self):
+        """P1/TC1, P1/TC5 y P2/TC4 dan lo mismo que los tres scripts."""
+        for test_case in ("P1/tests/TC1.txt", "P1/tests/TC5.txt",
+                          "P2/tests/TC4.txt"):
+            with self.subTest(test_case=test_case):
+                self._check(os.path.join(ROOT_DIR, test_case))
+
+    def test_blank_lines(self):
+        """Las líneas vacías y los datos inválidos se reportan igual."""
+        source = os.path.join(self.tmp_dir, "blank.txt")
+        with open(source, 'w', encoding='utf-8') as file:
+            file.write("10\n\nabc\n-3\n  \n2.5\n10\n")
+        self._check(source)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,197 @@
+"""
+Pruebas de tools_daemon.py y tools_client.py.
+
+Actividad 4.2 - TC4017 Calidad de Software
+Tecnológico de Monterrey
+"""
+
+import os
+import re
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+TOOLS_DIR = os.path.dirname(TESTS_DIR)
+ROOT_DIR = os.path.dirname(TOOLS_DIR)
+sys.path.insert(0, TOOLS_DIR)
+
+# pylint: disable=wrong-import-position,import-error
+import tools_client
+import tools_daemon
+# pylint: enable=wrong-import-position,import-error
+
+# Programa -> (script, archivo de resultados, carpeta de casos de prueba)
+SCRIPTS = {
+    'compute_statistics': ("P1/source/compute_statistics.py",
+                           "StatisticsResults.txt", "P1/tests"),
+    'convert_numbers': ("P2/source/convert_numbers.py",
+                        "ConvertionResults.txt", "P2/tests"),
+    'word_count': ("P3/source/word_count.py",
+                   "WordCountResults.txt", "P3/tests"),
+}
+
+# Tiempos transcurridos, que cambian entre ejecuciones
+ELAPSED_PATTERN = re.compile(r"\d+\.\d+( segundos|s\b)")
+
+
+def normalize(text):
+    """Reemplaza los tiempos transcurridos por una marca fija."""
+    return ELAPSED_PATTERN.sub("<tiempo>", text)
+
+
+class ToolServerTest(unittest.TestCase):
+    """El servidor da la misma salida y código que ejecutar el script."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server_dir = tempfile.mkdtemp()
+        cls.socket_path = os.path.join(cls.server_dir, "tools.sock")
+        cls.server = tools_daemon.ToolServer(cls.socket_path, 2)
+        cls.thread = threading.Thread(target=cls.server.serve_forever)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.thread.join()
+        cls.server.server_close()
+        shutil.rmtree(cls.server_dir)
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+
+    def _work_dir(self, name, tool, test_case):
+        """Directorio nuevo con una copia del caso de prueba."""
+        work_dir = tempfile.mkdtemp(prefix=name, dir=self.tmp_dir)
+        if test_case is not None:
+            source = os.path.join(ROOT_DIR, SCRIPTS[tool][2], test_case)
+            shutil.copy(source, work_dir)
+        return work_dir
+
+    @staticmethod
+    def _read_results(tool, work_dir):
+        """Contenido normalizado del archivo de resultados, o None."""
+        results_path = os.path.join(work_dir, SCRIPTS[tool][1])
+        if not os.path.exists(results_path):
+            return None
+        with open(results_path, 'r', encoding='utf-8') as file:
+            return normalize(file.read())
+
+    def _run_script(self, tool, test_case, args):
+        """Ejecuta el script en un proceso nuevo: (salida, código, resultados)."""
+        work_dir = self._work_dir("script", tool, test_case)
+        completed = subprocess.run(
+            [sys.executable, os.path.join(ROOT_DIR, SCRIPTS[tool][0]), *args],
+            cwd=work_dir, capture_output=True, text=True, check=False)
+        return (normalize(completed.stdout), completed.returncode,
+                self._read_results(tool, work_dir))
+
+    def _run_server(self, tool, test_case, args):
+        """Ejecuta el programa en el servidor: (salida, código, resultados)."""
+        work_dir = self._work_dir("server", tool, test_case)
+        response = tools_client.send_request(
+            {'tool': tool, 'args': list(args), 'cwd': work_dir},
+            self.socket_path)
+        return (normalize(response['output']), response['exit_code'],
+                self._read_results(tool, work_dir))
+
+    def test_matches_scripts(self):
+        """Misma salida, código y archivo de resultados que el script."""
+        cases = [
+            ('compute_statistics', "TC1.txt", "TC1.txt"),
+            ('convert_numbers', "TC1.txt", "TC1.txt"),
+            ('word_count', "TC1.txt", "TC1.txt"),
+            ('word_count', "TC2.txt", "TC2.txt", "--top", "5"),
+            ('word_count', None, "missing.txt"),
+            ('word_count', "TC1.txt", "TC1.txt", "--unknown"),
+            ('convert_numbers', None),
+        ]
+        for tool, test_case, *args in cases:
+            with self.subTest(tool=tool, args=args):
+                self.assertEqual(self._run_server(tool, test_case, args),
+                                 self._run_script(tool, test_case, args))
+
+    def test_exception_reports_traceback(self):
+        """Una excepción del programa responde su traza y código 1."""
+        work_dir = self._work_dir("server", 'word_count', None)
+        with open(os.path.join(work_dir, "bad.txt"), 'wb') as file:
+            file.write(b"hola\n\xff\xfe\n")
+        response = tools_client.send_request(
+            {'tool': 'word_count', 'args': ["bad.txt"], 'cwd': work_dir},
+            self.socket_path)
+        self.assertEqual(response['exit_code'], 1)
+        self.assertIn("UnicodeDecodeError", response['output'])
+
+        # El servidor sigue atendiendo trabajos después del error
+        _, exit_code, _ = self._run_server('word_count', "TC1.txt",
+                                           ["TC1.txt"])
+        self.assertEqual(exit_code, 0)
+
+    def test_recovers_from_dead_worker(self):
+        """Si un proceso del pool muere, el siguiente trabajo funciona."""
+        _, exit_code, _ = self._run_server('word_count', "TC1.txt",
+                                           ["TC1.txt"])
+        self.assertEqual(exit_code, 0)
+        executor = self.server.pool.executor
+        # pylint: disable-next=protected-access
+        os.kill(next(iter(executor._processes)), signal.SIGKILL)
+
+        expected = self._run_script('word_count', "TC1.txt", ["TC1.txt"])
+        for _ in range(2):
+            self.assertEqual(self._run_server('word_count', "TC1.txt",
+                                              ["TC1.txt"]), expected)
+
+    def test_unknown_tool(self):
+        """Un programa desconocido responde un error con código 1."""
+        response = tools_client.send_request(
+            {'tool': 'missing', 'args': [], 'cwd': self.tmp_dir},
+            self.socket_path)
+        self.assertEqual(response['exit_code'], 1)
+
+
+class ClientReplyTest(unittest.TestCase):
+    """El cliente rechaza respuestas vacías o inválidas."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.socket_path = os.path.join(self.tmp_dir, "fake.sock")
+
+    def _serve_once(self, reply):
+        """Servidor falso que responde reply a una sola conexión."""
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(self.socket_path)
+        listener.listen(1)
+        self.addCleanup(listener.close)
+
+        def answer():
+            connection, _ = listener.accept()
+            with connection, connection.makefile('rb') as reader:
+                reader.readline()
+                connection.sendall(reply)
+
+        thread = threading.Thread(target=answer)
+        thread.start()
+        self.addCleanup(thread.join)
+
+    def test_invalid_replies(self):
+        """Respuesta vacía, JSON inválido o sin campos: ValueError."""
+        for reply in (b"", b"no es json\n", b"[1, 2]\n", b"{}\n"):
+            with self.subTest(reply=reply):
+                if os.path.exists(self.socket_path):
+                    os.remove(self.socket_path)
+                self._serve_once(reply)
+                with self.assertRaises(ValueError):
+                    tools_client.run_remote('word_count', ["TC1.txt"],
+                                            self.socket_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
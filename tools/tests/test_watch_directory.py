@@ -0,0 +1,185 @@
+"""
+Pruebas de watch_directory.py.
+
+Actividad 4.2 - TC4017 Calidad de Software
+Tecnológico de Monterrey
+"""
+
+import asyncio
+import contextlib
+import io
+from concurrent.futures.process import BrokenProcessPool
+import os
+import shutil
+import signal
+import sys
+import tempfile
+import unittest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+TOOLS_DIR = os.path.dirname(TESTS_DIR)
+ROOT_DIR = os.path.dirname(TOOLS_DIR)
+sys.path.insert(0, TOOLS_DIR)
+
+# pylint: disable=wrong-import-position,import-error
+import watch_directory
+from tool_runner import ToolPool
+# pylint: enable=wrong-import-position,import-error
+
+
+def make_config(directory, **changes):
+    """Configuración de watch con valores chicos para las pruebas."""
+    config = {'directory': directory,
+              'rules': [("*.txt", 'word_count')],
+              'output': directory, 'jobs': 1, 'queue': 10,
+              'interval': 0.05, 'metrics': None, 'once': True}
+    config.update(changes)
+    return config
+
+
+class WatchDirectoryTest(unittest.TestCase):
+    """Recorrido del directorio vigilado en modo --once."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def _write(self, name, text):
+        """Crea un archivo de entrada en el directorio vigilado."""
+        with open(os.path.join(self.directory, name), 'w',
+                  encoding='utf-8') as file:
+            file.write(text)
+
+    def test_processes_and_moves_files(self):
+        """Cada archivo se procesa una vez y se mueve a processed/."""
+        shutil.copy(os.path.join(ROOT_DIR, "P3", "tests", "TC1.txt"),
+                    self.directory)
+        self._write("words.txt", "hola\nmundo\nhola\n")
+        with contextlib.redirect_stdout(io.StringIO()):
+            metrics = asyncio.run(watch_directory.watch(
+                make_config(self.directory)))
+
+        self.assertEqual((metrics['completed'], metrics['failed']), (2, 0))
+        self.assertEqual(
+            sorted(os.listdir(os.path.join(self.directory, "processed"))),
+            ["TC1.txt", "words.txt"])
+        # El archivo de resultados quedó en el directorio vigilado y no
+        # se tomó como entrada
+        self.assertIn("WordCountResults.txt", os.listdir(self.directory))
+        self.assertFalse(os.path.exists(
+            os.path.join(self.directory, "TC1.txt")))
+
+    def test_failed_files_move_to_failed(self):
+        """Un archivo con error se mueve a failed/."""
+        with open(os.path.join(self.directory, "bad.txt"), 'wb') as file:
+            file.write(b"\xff\xfe\n")
+        with contextlib.redirect_stdout(io.StringIO()):
+            metrics = asyncio.run(watch_directory.watch(
+                make_config(self.directory)))
+        self.assertEqual(metrics['failed'], 1)
+        self.assertEqual(os.listdir(os.path.join(self.directory, "failed")),
+                         ["bad.txt"])
+
+    def test_once_ends_when_pending_file_is_deleted(self):
+        """Un archivo borrado antes de encolarse no bloquea --once."""
+        self._write("gone.txt", "hola\n")
+        path = os.path.join(self.directory, "gone.txt")
+
+        async def scan():
+            queue = asyncio.Queue(10)
+            # Borrar el archivo después de la primera revisión
+            asyncio.get_running_loop().call_later(0.02, os.remove, path)
+            await asyncio.wait_for(watch_directory.scan_directory(
+                make_config(self.directory, interval=0.1), queue), 5)
+            return queue.qsize()
+
+        self.assertEqual(asyncio.run(scan()), 0)
+
+    def test_ignores_results_files(self):
+        """Los archivos de resultados nunca se enrutan."""
+        self._write("WordCountResults.txt", "Row Labels\n")
+        self._write("input.txt", "hola\n")
+        names = [name for _, name, _ in
+                 watch_directory._list_candidates(  # pylint: disable=protected-access
+                     self.directory)]
+        self.assertEqual(names, ["input.txt"])
+
+
+class BrokenPool:  # pylint: disable=too-few-public-methods
+    """Pool falso cuyo executor siempre está roto."""
+
+    async def run_async(self, tool, args, cwd):
+        """Falla como ToolPool cuando el reintento también rompe el pool."""
+        raise BrokenProcessPool(f"{tool} {args} {cwd}")
+
+
+class ProcessJobsTest(unittest.TestCase):
+    """process_jobs sobrevive a fallas del pool de procesos."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "words.txt")
+        with open(self.path, 'w', encoding='utf-8') as file:
+            file.write("hola\nmundo\n")
+
+    def _process(self, pool):
+        """Procesa words.txt con un solo worker y retorna las métricas."""
+        async def run():
+            queue = asyncio.Queue()
+            metrics = watch_directory.JobMetrics(queue)
+            await queue.put((self.path, 'word_count', 0.0))
+            worker = asyncio.create_task(watch_directory.process_jobs(
+                make_config(self.directory), queue, pool, metrics))
+            await asyncio.wait_for(queue.join(), 30)
+            worker.cancel()
+            await asyncio.gather(worker, return_exceptions=True)
+            return metrics.snapshot()
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            return asyncio.run(run())
+
+    def test_recovers_from_dead_worker(self):
+        """Tras matar un proceso del pool, el siguiente archivo se procesa."""
+        pool = ToolPool(1)
+        self.addCleanup(pool.shutdown)
+        self.assertEqual(pool.run('word_count', ["missing.txt"],
+                                  self.directory)[1], 1)
+        # pylint: disable-next=protected-access
+        os.kill(next(iter(pool.executor._processes)), signal.SIGKILL)
+
+        metrics = self._process(pool)
+        self.assertEqual(metrics['completed'], 1)
+        self.assertEqual(
+            os.listdir(os.path.join(self.directory, "processed")),
+            ["words.txt"])
+
+    def test_pool_failure_keeps_file(self):
+        """Una falla del pool no manda el archivo a failed/."""
+        metrics = self._process(BrokenPool())
+        self.assertEqual(metrics['failed'], 1)
+        self.assertTrue(os.path.exists(self.path))
+        self.assertFalse(os.path.exists(
+            os.path.join(self.directory, "failed")))
+
+
+class JobMetricsTest(unittest.TestCase):
+    """Las métricas de latencia son acumuladas y acotadas."""
+
+    def test_snapshot(self):
+        """Última, promedio y máxima latencia sin guardar cada una."""
+        metrics = watch_directory.JobMetrics(asyncio.Queue())
+        for latency, exit_code in ((1.0, 0), (3.0, 1), (2.0, 0)):
+            metrics.job_started()
+            metrics.job_finished(latency, exit_code)
+        snapshot = metrics.snapshot()
+        self.assertEqual((snapshot['completed'], snapshot['failed']), (2, 1))
+        self.assertEqual(snapshot['latency_last'], 2.0)
+        self.assertEqual(snapshot['latency_avg'], 2.0)
+        self.assertEqual(snapshot['latency_max'], 3.0)
+        self.assertFalse(any(isinstance(value, list)
+                             for value in vars(metrics).values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
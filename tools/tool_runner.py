@@ -0,0 +1,174 @@
+"""
+Carga y ejecución en proceso de compute_statistics, convert_numbers y
+word_count, compartidas por tools_daemon, watch_directory y analyze_all.
+
+Actividad 4.2 - TC4017 Calidad de Software
+Tecnológico de Monterrey
+"""
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import contextlib
+import importlib
+import io
+import multiprocessing
+import os
+import sys
+import threading
+import traceback
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Programa -> carpeta de su código fuente
+TOOLS = {
+    'compute_statistics': os.path.join(ROOT_DIR, 'P1', 'source'),
+    'convert_numbers': os.path.join(ROOT_DIR, 'P2', 'source'),
+    'word_count': os.path.join(ROOT_DIR, 'P3', 'source'),
+}
+
+# Intentos de un trabajo cuando un proceso del pool muere
+POOL_ATTEMPTS = 2
+
+
+def load_tools():
+    """
+    Importa los tres programas (se llama una vez por proceso del pool).
+
+    Returns:
+        Diccionario nombre -> módulo
+    """
+    modules = {}
+    for name, source_dir in TOOLS.items():
+        if source_dir not in sys.path:
+            sys.path.insert(0, source_dir)
+        modules[name] = importlib.import_module(name)
+    return modules
+
+
+def run_tool(tool, args, cwd):
+    """
+    Ejecuta el main() de un programa como si se llamara desde consola.
+
+    Args:
+        tool: Nombre del programa (llave de TOOLS)
+        args: Lista de argumentos (sin el nombre del script)
+        cwd: Directorio de trabajo del cliente
+
+    Returns:
+        Tupla (output, exit_code) con la salida de consola capturada; si
+        el programa lanza una excepción, output termina con su traza
+    """
+    module = load_tools()[tool]
+    output = io.StringIO()
+    exit_code = 0
+    previous_dir = os.getcwd()
+    previous_argv = sys.argv
+    try:
+        os.chdir(cwd)
+        sys.argv = [f"{tool}.py"] + list(args)
+        with contextlib.redirect_stdout(output):
+            try:
+                module.main()
+            except SystemExit as exit_request:
+                exit_code = _exit_code_of(exit_request)
+            except Exception:  # pylint: disable=broad-exception-caught
+                # Igual que el script: traza del error y código 1
+                output.write(traceback.format_exc())
+                exit_code = 1
+    finally:
+        sys.argv = previous_argv
+        os.chdir(previous_dir)
+    return output.getvalue(), exit_code
+
+
+def _exit_code_of(exit_request):
+    """Convierte el argumento de SystemExit en un código numérico."""
+    if exit_request.code is None:
+        return 0
+    if isinstance(exit_request.code, int):
+        return exit_request.code
+    print(exit_request.code)
+    return 1
+
+
+class ToolPool:
+    """
+    Pool de procesos con los tres programas cargados que se recupera solo.
+
+    Si un proceso del pool muere (OOM, señal, os._exit) el
+    ProcessPoolExecutor queda roto para siempre; aquí se reemplaza por
+    uno nuevo y el trabajo afectado se reintenta una vez. Los procesos
+    se crean con forkserver, no bifurcando hilos del llamador.
+    """
+
+    def __init__(self, workers=None):
+        self.workers = workers
+        self._lock = threading.Lock()
+        self.executor = self._new_executor()
+
+    def _new_executor(self):
+        """Crea el ProcessPoolExecutor con los programas precargados."""
+        return ProcessPoolExecutor(
+            self.workers, mp_context=multiprocessing.get_context('forkserver'),
+            initializer=load_tools)
+
+    def _replace(self, broken):
+        """Reemplaza el executor si sigue siendo el que se rompió."""
+        with self._lock:
+            if self.executor is broken:
+                self.executor = self._new_executor()
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, tool, args, cwd):
+        """
+        Envía run_tool al executor actual.
+
+        Returns:
+            Tupla (executor, future) para saber qué executor reemplazar
+        """
+        with self._lock:
+            executor = self.executor
+        try:
+            return executor, executor.submit(run_tool, tool, args, cwd)
+        except BrokenProcessPool:
+            self._replace(executor)
+            return self._submit(tool, args, cwd)
+
+    def run(self, tool, args, cwd):
+        """
+        Ejecuta run_tool en el pool y espera su resultado.
+
+        Returns:
+            Tupla (output, exit_code)
+
+        Raises:
+            BrokenProcessPool: Si el trabajo rompió el pool en cada intento
+        """
+        for attempt in range(1, POOL_ATTEMPTS + 1):
+            executor, future = self._submit(tool, args, cwd)
+            try:
+                return future.result()
+            except BrokenProcessPool:
+                self._replace(executor)
+                if attempt == POOL_ATTEMPTS:
+                    raise
+        return None
+
+    async def run_async(self, tool, args, cwd):
+        """Igual que run, pero espera el resultado sin bloquear el loop."""
+        for attempt in range(1, POOL_ATTEMPTS + 1):
+            executor, future = self._submit(tool, args, cwd)
+            try:
+                return await asyncio.wrap_future(future)
+            except BrokenProcessPool:
+                self._replace(executor)
+                if attempt == POOL_ATTEMPTS:
+                    raise
+        return None
+
+    def shutdown(self):
+        """Termina el pool actual esperando los trabajos en curso."""
+        with self._lock:
+            executor = self.executor
+        executor.shutdown()
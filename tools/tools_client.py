@@ -0,0 +1,99 @@
+"""
+Cliente ligero para el servidor de tools_daemon.py.
+
+Actividad 4.2 - TC4017 Calidad de Software
+Tecnológico de Monterrey
+
+No importa los programas: solo envía el trabajo por el socket e imprime
+la misma salida que el script, terminando con su mismo código de salida.
+
+Uso: python tools_client.py [--socket RUTA] PROGRAMA [argumentos...]
+     python tools_client.py [--socket RUTA] --shutdown
+PROGRAMA: compute_statistics, convert_numbers o word_count
+"""
+
+import json
+import os
+import socket
+import sys
+import tempfile
+
+DEFAULT_SOCKET = os.path.join(tempfile.gettempdir(), "a42_tools.sock")
+
+USAGE = ("Uso: python tools_client.py [--socket RUTA] "
+         "PROGRAMA [argumentos...]")
+
+
+def send_request(request, socket_path=DEFAULT_SOCKET):
+    """
+    Envía una solicitud al servidor y espera su respuesta.
+
+    Args:
+        request: Diccionario serializable a JSON
+        socket_path: Ruta del socket de dominio Unix
+
+    Returns:
+        Diccionario con la respuesta ('output', 'exit_code')
+
+    Raises:
+        OSError: Si no se puede conectar con el servidor
+        ValueError: Si la respuesta está vacía o no es un objeto JSON
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        client.sendall(json.dumps(request).encode('utf-8') + b"\n")
+        with client.makefile('rb') as reader:
+            line = reader.readline()
+    if not line:
+        raise ValueError("el servidor cerró la conexión sin responder")
+    response = json.loads(line)
+    if not isinstance(response, dict):
+        raise ValueError("la respuesta no es un objeto JSON")
+    return response
+
+
+def run_remote(tool, args, socket_path=DEFAULT_SOCKET):
+    """
+    Ejecuta un programa en el servidor desde el directorio actual.
+
+    Returns:
+        Tupla (output, exit_code)
+    """
+    response = send_request(
+        {'tool': tool, 'args': list(args), 'cwd': os.getcwd()}, socket_path)
+    output = response.get('output')
+    exit_code = response.get('exit_code')
+    if not isinstance(output, str) or not isinstance(exit_code, int):
+        raise ValueError("la respuesta no tiene 'output' y 'exit_code'")
+    return output, exit_code
+
+
+def main():
+    """Función principal del cliente."""
+    args = sys.argv[1:]
+    socket_path = DEFAULT_SOCKET
+    if len(args) >= 2 and args[0] == '--socket':
+        socket_path = args[1]
+        args = args[2:]
+    if not args:
+        print(USAGE)
+        sys.exit(1)
+
+    try:
+        if args[0] == '--shutdown':
+            send_request({'command': 'shutdown'}, socket_path)
+            return
+        output, exit_code = run_remote(args[0], args[1:], socket_path)
+    except OSError as socket_error:
+        print(f"Error: No se pudo conectar al servidor: {socket_error}")
+        sys.exit(1)
+    except ValueError as reply_error:
+        print(f"Error: Respuesta inválida del servidor: {reply_error}")
+        sys.exit(1)
+
+    sys.stdout.write(output)
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Servidor persistente para ejecutar compute_statistics, convert_numbers y
+word_count sin pagar el arranque del intérprete en cada archivo.
+
+Actividad 4.2 - TC4017 Calidad de Software
+Tecnológico de Monterrey
+
+El servidor escucha en un socket de dominio Unix. Cada trabajo llega como
+una línea JSON {"tool", "args", "cwd"} y se ejecuta en un pool de procesos
+que ya tiene importados los tres programas. La respuesta es una línea JSON
+{"output", "exit_code"} con la misma salida de consola del script; los
+archivos de resultados se actualizan en el directorio "cwd" del cliente.
+
+Uso: python tools_daemon.py [--socket RUTA] [--workers N]
+"""
+
+import json
+import os
+import socketserver
+import sys
+import tempfile
+import threading
+
+from tool_runner import TOOLS, ToolPool
+
+DEFAULT_SOCKET = os.path.join(tempfile.gettempdir(), "a42_tools.sock")
+
+USAGE = "Uso: python tools_daemon.py [--socket RUTA] [--workers N]"
+
+
+class ToolRequestHandler(socketserver.StreamRequestHandler):
+    """Atiende una conexión: lee un trabajo JSON y responde su resultado."""
+
+    def handle(self):
+        line = self.rfile.readline()
+        try:
+            request = json.loads(line)
+        except ValueError:
+            self._reply({'output': "Error: Solicitud inválida\n",
+                         'exit_code': 1})
+            return
+
+        if request.get('command') == 'shutdown':
+            self._reply({'output': "", 'exit_code': 0})
+            threading.Thread(target=self.server.shutdown).start()
+            return
+
+        tool = request.get('tool')
+        if tool not in TOOLS:
+            self._reply({'output': f"Error: Programa desconocido: {tool}\n",
+                         'exit_code': 1})
+            return
+
+        try:
+            output, exit_code = self.server.pool.run(
+                tool, request.get('args', []),
+                request.get('cwd', os.getcwd()))
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            # El trabajo rompió el pool (también al reintentarlo) o su
+            # resultado no se pudo enviar
+            self._reply({'output': f"Error: Falló la ejecución: {error}\n",
+                         'exit_code': 1})
+            return
+        self._reply({'output': output, 'exit_code': exit_code})
+
+    def _reply(self, response):
+        """Envía la respuesta como una línea JSON."""
+        self.wfile.write(json.dumps(response).encode('utf-8') + b"\n")
+
+
+class ToolServer(socketserver.ThreadingUnixStreamServer):
+    """Servidor Unix con un pool de procesos que mantiene los programas."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path, workers):
+        self.pool = ToolPool(workers)
+        super().__init__(socket_path, ToolRequestHandler)
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown()
+
+
+def serve(socket_path=DEFAULT_SOCKET, workers=None):
+    """
+    Inicia el servidor y atiende trabajos hasta recibir 'shutdown'.
+
+    Args:
+        socket_path: Ruta del socket de dominio Unix
+        workers: Número de procesos del pool (None: uno por CPU)
+    """
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+    with ToolServer(socket_path, workers) as server:
+        print(f"Servidor escuchando en: {socket_path}")
+        sys.stdout.flush()
+        try:
+            server.serve_forever()
+        finally:
+            os.remove(socket_path)
+
+
+def _parse_args(args):
+    """Valida los argumentos y retorna (socket_path, workers)."""
+    socket_path = DEFAULT_SOCKET
+    workers = None
+    i = 0
+    while i < len(args):
+        if args[i] == '--socket' and i + 1 < len(args):
+            socket_path = args[i + 1]
+        elif args[i] == '--workers' and i + 1 < len(args):
+            if not args[i + 1].isdigit() or int(args[i + 1]) <= 0:
+                print(USAGE)
+                sys.exit(1)
+            workers = int(args[i + 1])
+        else:
+            print(USAGE)
+            sys.exit(1)
+        i += 2
+    return socket_path, workers
+
+
+def main():
+    """Función principal del servidor."""
+    socket_path, workers = _parse_args(sys.argv[1:])
+    serve(socket_path, workers)
+
+
+if __name__ == "__main__":
+    main()
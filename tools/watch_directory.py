@@ -0,0 +1,300 @@
+"""
+Servicio asyncio que vigila un directorio de entrada y procesa cada
+archivo nuevo con compute_statistics, convert_numbers o word_count.
+
+Actividad 4.2 - TC4017 Calidad de Software
+Tecnológico de Monterrey
+
+Un archivo se considera completo cuando su tamaño y fecha de modificación
+no cambian entre dos revisiones seguidas. Las reglas --rule PATRON=PROGRAMA
+(patrones tipo glob, se usa la primera que coincida) deciden qué programa
+lo procesa. El trabajo pesado corre en un pool de procesos con a lo más
+--jobs trabajos simultáneos; la cola de espera es acotada (--queue), así
+que la revisión del directorio se detiene mientras la cola está llena.
+
+Al terminar, cada archivo se mueve a la subcarpeta processed/ (o failed/
+si el programa terminó con error), así que un reinicio del servicio no
+lo vuelve a procesar. Los archivos de resultados (*Results.txt) nunca se
+toman como entrada, aunque --output sea el directorio vigilado.
+
+Uso: python watch_directory.py DIRECTORIO --rule PATRON=PROGRAMA [...]
+         [--output DIR] [--jobs N] [--queue N] [--interval SEG]
+         [--metrics ARCHIVO.json] [--once]
+"""
+
+import asyncio
+import fnmatch
+import json
+import os
+import sys
+import time
+
+from tool_runner import TOOLS, ToolPool
+
+USAGE = ("Uso: python watch_directory.py DIRECTORIO --rule PATRON=PROGRAMA "
+         "[...] [--output DIR] [--jobs N] [--queue N] [--interval SEG] "
+         "[--metrics ARCHIVO.json] [--once]")
+
+# Archivos que todavía se están copiando, temporales o de resultados
+IGNORED_PATTERNS = (".*", "*.tmp", "*.part", "*.lock", "*Results.txt")
+
+# Subcarpetas del directorio vigilado para los archivos ya procesados
+PROCESSED_DIR = "processed"
+FAILED_DIR = "failed"
+
+
+def route_file(filename, rules):
+    """
+    Elige el programa para un archivo según las reglas.
+
+    Args:
+        filename: Nombre del archivo (sin directorio)
+        rules: Lista de tuplas (patron, programa)
+
+    Returns:
+        Nombre del programa, o None si ninguna regla coincide
+    """
+    for pattern, tool in rules:
+        if fnmatch.fnmatch(filename, pattern):
+            return tool
+    return None
+
+
+class JobMetrics:
+    """Métricas del servicio: profundidad de la cola y latencia por trabajo."""
+
+    def __init__(self, queue, metrics_path=None):
+        self.queue = queue
+        self.metrics_path = metrics_path
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        # Estadísticas acumuladas: no guardan cada latencia
+        self.latency = {'last': 0.0, 'total': 0.0, 'max': 0.0}
+
+    def job_started(self):
+        """Registra que un trabajo salió de la cola."""
+        self.running += 1
+
+    def job_finished(self, latency, exit_code):
+        """Registra un trabajo terminado y actualiza el archivo de métricas."""
+        self.running -= 1
+        if exit_code == 0:
+            self.completed += 1
+        else:
+            self.failed += 1
+        self.latency['last'] = latency
+        self.latency['total'] += latency
+        self.latency['max'] = max(self.latency['max'], latency)
+        if self.metrics_path is not None:
+            temp_path = self.metrics_path + ".tmp"
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(self.snapshot(), file, indent=2)
+            os.replace(temp_path, self.metrics_path)
+
+    def snapshot(self):
+        """Diccionario con las métricas actuales."""
+        finished = self.completed + self.failed
+        latency = self.latency
+        return {
+            'queue_depth': self.queue.qsize(),
+            'running': self.running,
+            'completed': self.completed,
+            'failed': self.failed,
+            'latency_last': latency['last'],
+            'latency_avg': latency['total'] / finished if finished else 0.0,
+            'latency_max': latency['max'],
+        }
+
+
+def _list_candidates(directory):
+    """Genera (ruta, nombre, (tamaño, mtime)) de los archivos del directorio."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            if any(fnmatch.fnmatch(entry.name, pattern)
+                   for pattern in IGNORED_PATTERNS):
+                continue
+            stat = entry.stat()
+            yield entry.path, entry.name, (stat.st_size, stat.st_mtime_ns)
+
+
+async def scan_directory(config, queue):
+    """
+    Revisa el directorio y encola los archivos completos.
+
+    Un archivo se encola cuando su (tamaño, mtime) se repite en dos
+    revisiones seguidas; si después cambia, se vuelve a procesar. Los
+    archivos que desaparecen (movidos a processed/ o borrados) se olvidan.
+    En modo --once termina cuando ya no hay archivos pendientes.
+    """
+    processed = {}
+    pending = {}
+    while True:
+        changing = False
+        candidates = list(_list_candidates(config['directory']))
+        present = {path for path, _, _ in candidates}
+        for table in (processed, pending):
+            for path in [path for path in table if path not in present]:
+                del table[path]
+
+        for path, name, signature in candidates:
+            if processed.get(path) == signature:
+                continue
+            if pending.get(path) != signature:
+                pending[path] = signature
+                changing = True
+                continue
+
+            del pending[path]
+            processed[path] = signature
+            tool = route_file(name, config['rules'])
+            if tool is None:
+                print(f"Aviso: Ninguna regla para el archivo: {name}")
+                continue
+            # Se bloquea mientras la cola está llena (backpressure)
+            await queue.put((path, tool, time.monotonic()))
+
+        if config['once'] and not changing and not pending:
+            return
+        await asyncio.sleep(config['interval'])
+
+
+def _archive_file(path, exit_code):
+    """Mueve un archivo procesado a processed/ (o failed/ si falló)."""
+    folder = PROCESSED_DIR if exit_code == 0 else FAILED_DIR
+    target_dir = os.path.join(os.path.dirname(path), folder)
+    try:
+        os.makedirs(target_dir, exist_ok=True)
+        os.replace(path, os.path.join(target_dir, os.path.basename(path)))
+    except OSError as error:
+        print(f"Aviso: No se pudo mover el archivo {path}: {error}")
+
+
+async def process_jobs(config, queue, pool, metrics):
+    """
+    Toma trabajos de la cola y los ejecuta en el pool de procesos.
+
+    Solo se archiva un archivo cuando el programa terminó (con o sin
+    error). Si falla el pool (ToolPool ya lo reemplazó y reintentó), el
+    archivo se queda en el directorio vigilado para revisarlo a mano.
+    """
+    while True:
+        path, tool, enqueued = await queue.get()
+        metrics.job_started()
+        try:
+            output, exit_code = await pool.run_async(tool, [path],
+                                                     config['output'])
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            output, exit_code = f"Error: {error}\n", 1
+            print(f"Aviso: Falló el pool de procesos; {path} no se movió")
+        else:
+            _archive_file(path, exit_code)
+        latency = time.monotonic() - enqueued
+        metrics.job_finished(latency, exit_code)
+
+        print(f"== {tool} {os.path.basename(path)} "
+              f"(código {exit_code}, {latency:.3f}s, "
+              f"cola {queue.qsize()})")
+        sys.stdout.write(output)
+        sys.stdout.flush()
+        queue.task_done()
+
+
+async def watch(config):
+    """
+    Ejecuta el servicio de vigilancia.
+
+    Args:
+        config: Diccionario con directory, rules, output, jobs, queue,
+                interval, metrics y once
+    """
+    queue = asyncio.Queue(config['queue'])
+    metrics = JobMetrics(queue, config['metrics'])
+    pool = ToolPool(config['jobs'])
+    workers = [asyncio.create_task(process_jobs(config, queue, pool,
+                                                metrics))
+               for _ in range(config['jobs'])]
+    try:
+        await scan_directory(config, queue)
+        await queue.join()
+    finally:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        pool.shutdown()
+    return metrics.snapshot()
+
+
+def _parse_rule(text):
+    """Convierte 'PATRON=PROGRAMA' en tupla; termina si no es válida."""
+    pattern, _, tool = text.partition('=')
+    if not pattern or tool not in TOOLS:
+        print(f"Error: Regla inválida: {text}")
+        sys.exit(1)
+    return pattern, tool
+
+
+def _parse_number(text, kind):
+    """Convierte un valor positivo (int o float); termina si no es válido."""
+    try:
+        value = kind(text)
+    except ValueError:
+        value = 0
+    if value <= 0:
+        print(USAGE)
+        sys.exit(1)
+    return value
+
+
+def _parse_args(args):
+    """Valida los argumentos de línea de comandos y retorna la configuración."""
+    config = {'directory': None, 'rules': [], 'output': os.getcwd(),
+              'jobs': os.cpu_count() or 1, 'queue': 100, 'interval': 1.0,
+              'metrics': None, 'once': False}
+    parsers = {
+        '--rule': lambda value: config['rules'].append(_parse_rule(value)),
+        '--output': lambda value: config.update(output=os.path.abspath(value)),
+        '--jobs': lambda value: config.update(jobs=_parse_number(value, int)),
+        '--queue': lambda value: config.update(queue=_parse_number(value, int)),
+        '--interval': lambda value: config.update(
+            interval=_parse_number(value, float)),
+        '--metrics': lambda value: config.update(metrics=value),
+    }
+    i = 0
+    while i < len(args):
+        if args[i] in parsers and i + 1 < len(args):
+            parsers[args[i]](args[i + 1])
+            i += 2
+        elif args[i] == '--once':
+            config['once'] = True
+            i += 1
+        elif config['directory'] is None and not args[i].startswith('--'):
+            config['directory'] = os.path.abspath(args[i])
+            i += 1
+        else:
+            print(USAGE)
+            sys.exit(1)
+
+    if config['directory'] is None or not config['rules']:
+        print(USAGE)
+        sys.exit(1)
+    if not os.path.isdir(config['directory']):
+        print(f"Error: Directorio no encontrado: {config['directory']}")
+        sys.exit(1)
+    return config
+
+
+def main():
+    """Función principal del servicio."""
+    config = _parse_args(sys.argv[1:])
+    try:
+        metrics = asyncio.run(watch(config))
+    except KeyboardInterrupt:
+        return
+    print(f"Métricas: {json.dumps(metrics)}")
+
+
+if __name__ == "__main__":
+    main()